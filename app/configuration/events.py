@@ -6,6 +6,7 @@ from dependency_injector.wiring import inject, Provide
 from fastapi import FastAPI
 
 from app.pkg.clients import Clients, TelegramClient
+from app.internal.services import FSMService
 from app.internal.workers import Workers, WebsiteScraperWorker
 from app.pkg.settings import settings
 
@@ -32,6 +33,7 @@ async def lifespan(
     await telegram_client.set_webhook(
         webhook_url=settings.TELEGRAM.BOT_WEBHOOK_URL,
         secret_token=settings.TELEGRAM.SECRET_TOKEN,
+        allowed_updates=FSMService.allowed_updates,
     )
     await website_scraper_worker.run()
     yield
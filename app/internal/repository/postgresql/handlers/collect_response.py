@@ -1,7 +1,8 @@
 """Collect response from aiopg and convert it to an annotated model."""
 
-from functools import wraps
-from typing import List, Type, Union
+from decimal import Decimal
+from functools import lru_cache, wraps
+from typing import Any, FrozenSet, List, Type, Union, get_args, get_origin
 
 import pydantic
 from psycopg2.extras import RealDictRow  # type: ignore
@@ -75,14 +76,85 @@ def collect_response(fn):
         if not response:
             raise EmptyResult
 
-        return pydantic.parse_obj_as(
-            (ann := fn.__annotations__["return"]),
-            await __convert_response(response=response, annotations=str(ann)),
+        ann = fn.__annotations__["return"]
+        return __construct_response(
+            annotation=ann,
+            response=await __convert_response(
+                response=response,
+                annotations=str(ann),
+            ),
         )
 
     return inner
 
 
+def __construct_response(annotation: Any, response: Any):
+    """Build the model or list of models of ``annotation`` from rows.
+
+    Rows come from our own tables, so they are built with ``construct()``
+    instead of being validated again, see :func:`.__construct_model`. Other
+    annotations are parsed with full validation.
+
+    Args:
+        annotation:
+            Return annotation of `fn`.
+        response:
+            Converted response of an aiopg query.
+
+    Returns:
+        The model or list of models that is specified in ``annotation``.
+    """
+
+    if get_origin(annotation) is list:
+        (model,) = get_args(annotation)
+        if __is_model(model):
+            return [__construct_model(model, row) for row in response]
+    elif __is_model(annotation):
+        return __construct_model(annotation, response)
+    return pydantic.parse_obj_as(annotation, response)
+
+
+def __construct_model(model: Type[Model], row: RealDictRow) -> Model:
+    """Build ``model`` from a row without validating it.
+
+    Notes:
+        psycopg2 returns ``numeric`` columns (like ``user_specifics.user_id``)
+        as ``Decimal``. Such values of ``int`` fields are converted to ``int``,
+        as validation would do.
+
+    Returns:
+        Instance of ``model``.
+    """
+
+    for name in __integer_fields(model):
+        value = row.get(name)
+        if isinstance(value, Decimal):
+            row[name] = int(value)
+    return model.construct(**row)
+
+
+@lru_cache(maxsize=None)
+def __integer_fields(model: Type[Model]) -> FrozenSet[str]:
+    """Return names of ``int`` fields of ``model``."""
+
+    return frozenset(
+        name
+        for name, field in model.__fields__.items()
+        if isinstance(field.type_, type)
+        and issubclass(field.type_, int)
+        and not issubclass(field.type_, bool)
+    )
+
+
+def __is_model(annotation: Any) -> bool:
+    """Check whether ``annotation`` is a pydantic model class."""
+
+    return isinstance(annotation, type) and issubclass(
+        annotation,
+        pydantic.BaseModel,
+    )
+
+
 async def __convert_response(response: RealDictRow, annotations: str):
     """Converts the response of the request to List of models or to a single
     model.
@@ -1,7 +1,7 @@
 """Webhooks router for telegram bot requests processing."""
 
 from dependency_injector.wiring import Provide, inject
-from fastapi import Depends
+from fastapi import Depends, Request
 from pydantic import ValidationError
 
 from app.internal.routes import webhooks_router
@@ -15,13 +15,15 @@ from app.pkg.settings import settings
 )
 @inject
 async def handle_client_bot_update(
-    update: dict,
+    request: Request,
     fsm_service: FSMService = Depends(
         Provide[Services.fsm_service],
     ),
 ):
+    # Secret token of the request is verified by the router, so the update
+    # comes from Telegram and is not validated again.
     try:
-        update_model = Update(**update)
+        update_model = Update.from_bytes(await request.body(), trusted=True)
     except ValidationError:
         return
     await fsm_service.process_update(update_model)
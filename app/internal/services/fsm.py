@@ -1,7 +1,7 @@
 """FSM service implementation."""
 
 from logging import Logger
-from typing import Callable, Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
 
 import pydantic
@@ -21,6 +21,37 @@ from app.internal.services.supported_programms import SupportedProgrammsService
 from app.internal.services.openai import OpenAIService
 from app.internal.services.user_specifics import UserSpecificsService
 
+# Reply keyboards never change, so they are built and validated once on import
+# instead of on every processed update.
+_MAIN_MENU_KEYBOARD = ReplyKeyboardMarkup(
+    keyboard=[
+        [
+            KeyboardButton(
+                text="❓ Задать вопрос о программе",
+            ),
+        ],
+        [
+            KeyboardButton(
+                text="❗️ Получить рекоммендацию",
+            ),
+        ],
+    ],
+    resize_keyboard=True,
+    is_persistent=True,
+)
+
+_RETURN_TO_MAIN_MENU_KEYBOARD = ReplyKeyboardMarkup(
+    keyboard=[
+        [
+            KeyboardButton(
+                text="Вернуться в главное меню",
+            ),
+        ],
+    ],
+    resize_keyboard=True,
+    is_persistent=True,
+)
+
 
 class FSMService:
     """FSM service.
@@ -29,6 +60,10 @@ class FSMService:
     processed according to configured FSM.
     """
 
+    #: Tuple[str, ...]: Types of updates the service processes. Telegram is
+    #  asked to send only these, see :meth:`__determine_update_type`.
+    allowed_updates: Tuple[str, ...] = ("message",)
+
     __logger: Logger = get_logger(__name__)
     __supported_programs_service: SupportedProgrammsService
     __user_specifics_service: UserSpecificsService
@@ -89,12 +124,11 @@ class FSMService:
     ) -> Optional[StateInformation]:
         """Parse client state information from redis."""
 
-        response: dict[bytes, bytes] = (await self.__redis_client.hgetall(client_id))[0]
+        response: dict[str, str] = await self.__redis_client.hgetall(client_id)
         if response == {}:
             return None
         try:
-            decoded_response = {k.decode(): v.decode() for k, v in response.items()}
-            state_information = StateInformation(**decoded_response)
+            state_information = StateInformation(**response)
             keys_to_delete = []
             if keys_to_delete:
                 await self.__redis_client.hdel(client_id, keys_to_delete)
@@ -205,8 +239,7 @@ class FSMService:
         client_id = (
             update.message.from_.id if update.message.from_ else update.message.chat.id
         )
-        await self.__redis_client.delete(client_id)
-        await self.__redis_client.hmset(
+        await self.__redis_client.replace(
             client_id,
             StateInformation(
                 state=States.MAIN_MENU,
@@ -218,16 +251,18 @@ class FSMService:
                 chat_id=client_id,
                 text="""Привет!
 Я помогу тебе с выбором программы для поступления в магистратуру ИТМО""",
-                reply_markup=InlineKeyboardMarkup(
-                    inline_keyboard=[
-                        [
-                            InlineKeyboardButton(
+                # Markup is built from our own data on every start, so it is
+                # constructed without validation.
+                reply_markup=InlineKeyboardMarkup.construct(
+                    inline_keyboard=tuple(
+                        (
+                            InlineKeyboardButton.construct(
                                 text=program.name,
                                 url=program.website_url,
                             ),
-                        ]
+                        )
                         for program in supported_programs
-                    ],
+                    ),
                 ),
             ),
         ]
@@ -253,22 +288,7 @@ class FSMService:
             await self.__telegram_client.send_message(
                 chat_id=client_id,
                 text="""С чем я могу помочь?""",
-                reply_markup=ReplyKeyboardMarkup(
-                    keyboard=[
-                        [
-                            KeyboardButton(
-                                text="❓ Задать вопрос о программе",
-                            ),
-                        ],
-                        [
-                            KeyboardButton(
-                                text="❗️ Получить рекоммендацию",
-                            ),
-                        ],
-                    ],
-                    resize_keyboard=True,
-                    is_persistent=True,
-                ),
+                reply_markup=_MAIN_MENU_KEYBOARD,
             ),
         ]
 
@@ -291,17 +311,7 @@ class FSMService:
             await self.__telegram_client.send_message(
                 chat_id=client_id,
                 text="""Задай свой вопрос о программе, и я постараюсь на него ответить!""",  # pylint: disable=line-too-long
-                reply_markup=ReplyKeyboardMarkup(
-                    keyboard=[
-                        [
-                            KeyboardButton(
-                                text="Вернуться в главное меню",
-                            ),
-                        ],
-                    ],
-                    resize_keyboard=True,
-                    is_persistent=True,
-                ),
+                reply_markup=_RETURN_TO_MAIN_MENU_KEYBOARD,
             ),
         ]
 
@@ -320,17 +330,7 @@ class FSMService:
         await self.__telegram_client.send_message(
             chat_id=client_id,
             text="Пожалуйста, подожди, я ищу ответ на твой вопрос...",
-            reply_markup=ReplyKeyboardMarkup(
-                keyboard=[
-                    [
-                        KeyboardButton(
-                            text="Вернуться в главное меню",
-                        ),
-                    ],
-                ],
-                resize_keyboard=True,
-                is_persistent=True,
-            ),
+            reply_markup=_RETURN_TO_MAIN_MENU_KEYBOARD,
         )
         programs = await self.__supported_programs_service.get_programs()
         response = await self.__openai_service.answer_question(
@@ -364,17 +364,7 @@ class FSMService:
             await self.__telegram_client.send_message(
                 chat_id=client_id,
                 text="""Расскажи мне про себя и я постараюсь подобрать тебе программу, которая тебе подойдет!""",  # pylint: disable=line-too-long
-                reply_markup=ReplyKeyboardMarkup(
-                    keyboard=[
-                        [
-                            KeyboardButton(
-                                text="Вернуться в главное меню",
-                            ),
-                        ],
-                    ],
-                    resize_keyboard=True,
-                    is_persistent=True,
-                ),
+                reply_markup=_RETURN_TO_MAIN_MENU_KEYBOARD,
             ),
         ]
 
@@ -403,17 +393,7 @@ class FSMService:
         await self.__telegram_client.send_message(
             chat_id=client_id,
             text="Пожалуйста, подожди, я ищу подходящую для тебя программу...",
-            reply_markup=ReplyKeyboardMarkup(
-                keyboard=[
-                    [
-                        KeyboardButton(
-                            text="Вернуться в главное меню",
-                        ),
-                    ],
-                ],
-                resize_keyboard=True,
-                is_persistent=True,
-            ),
+            reply_markup=_RETURN_TO_MAIN_MENU_KEYBOARD,
         )
         return [
             await self.__telegram_client.send_message(
@@ -3,7 +3,7 @@
 from logging import Logger
 from typing import List
 
-from app.pkg.connectors.redis.connection import get_connection
+from app.pkg.connectors.redis.connection import get_connection, get_pool
 from app.pkg.logger import get_logger
 
 
@@ -13,19 +13,21 @@ class RedisClient:
     __logger: Logger = get_logger(__name__)
 
     async def hmset(self, key: str, value: dict):
-        async with get_connection() as connection:
-            return await connection.hset(key, mapping=value).execute()
+        async with get_pool() as connection:
+            return await connection.hset(key, mapping=value)
 
     async def hgetall(self, key: str):
-        async with get_connection() as connection:
-            return await connection.hgetall(key).execute()
+        async with get_pool() as connection:
+            return await connection.hgetall(key)
 
     async def hdel(self, key: str, fields: List[str]):
-        async with get_connection() as connection:
-            for field in fields:
-                await connection.hdel(key, field)
-            return await connection.execute()
+        async with get_pool() as connection:
+            return await connection.hdel(key, *fields)
 
     async def delete(self, key: str):
+        async with get_pool() as connection:
+            return await connection.delete(key)
+
+    async def replace(self, key: str, value: dict):
         async with get_connection() as connection:
-            return await connection.delete(key).execute()
+            return await connection.delete(key).hset(key, mapping=value).execute()
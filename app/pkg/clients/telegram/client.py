@@ -1,16 +1,15 @@
 """Telegram client implementation."""
 
-import json
 import typing
 from logging import Logger
-from typing import Any, List, Optional, Union
+from typing import Any, List, Optional, Sequence, Union
 
 from httpcore import Response
 import httpx
 import pydantic
-from pydantic.json import pydantic_encoder
 
 from app.pkg.clients.telegram.handlers.collect_response import collect_response
+from app.pkg.clients.telegram.models import dumps
 from app.pkg.clients.telegram.models.enums import Methods
 from app.pkg.clients.telegram.models.request import (
     ForceReply,
@@ -28,6 +27,7 @@ from app.pkg.clients.telegram.models.response import (
     TelegramAPIDeleteMessageResponse,
     TelegramAPIGetChatMemberResponse,
     TelegramAPIGetChatResponse,
+    TelegramAPIGetUserChatBoostsResponse,
     TelegramAPISendMessageResponse,
     TelegramAPIWebhookResponse,
     TelegramFileResponse,
@@ -119,15 +119,24 @@ class TelegramClient:
         self,
         webhook_url: pydantic.AnyUrl,
         secret_token: pydantic.SecretStr,
+        allowed_updates: Optional[Sequence[str]] = None,
     ) -> TelegramAPIWebhookResponse:
-        """Set webhook url for the telegram bot."""
+        """Set webhook url for the telegram bot.
 
+        :param allowed_updates: Update types the bot receives, e.g.
+            ``["message"]``. Other updates are not sent to the webhook at
+            all. By default, the previous setting is kept.
+        """
+
+        params = {
+            "url": webhook_url,
+            "secret_token": secret_token.get_secret_value(),
+        }
+        if allowed_updates is not None:
+            params["allowed_updates"] = dumps(allowed_updates)
         return await self.__make_request(
             path="/setWebhook",
-            params={
-                "url": webhook_url,
-                "secret_token": secret_token.get_secret_value(),
-            },
+            params=params,
         )
 
     @collect_response
@@ -191,26 +200,17 @@ class TelegramClient:
                 "business_connection_id": business_connection_id,
                 "message_thread_id": message_thread_id,
                 "parse_mode": parse_mode,
-                "entities": json.dumps(entities, default=pydantic_encoder)
-                if entities
-                else None,
-                "link_preview_options": json.dumps(
-                    link_preview_options,
-                    default=pydantic_encoder,
-                )
+                "entities": dumps(entities) if entities else None,
+                "link_preview_options": dumps(link_preview_options)
                 if link_preview_options
                 else None,
                 "disable_notification": disable_notification,
                 "protect_content": protect_content,
                 "message_effect_id": message_effect_id,
-                "reply_parameters": reply_parameters.json(
-                    exclude_none=True,
-                )
+                "reply_parameters": dumps(reply_parameters)
                 if reply_parameters
                 else None,
-                "reply_markup": reply_markup.json(exclude_none=True)
-                if reply_markup
-                else None,
+                "reply_markup": reply_markup.to_json() if reply_markup else None,
             },
         )
 
@@ -302,24 +302,17 @@ class TelegramClient:
                 "thumbnail": thumbnail,
                 "caption": caption,
                 "parse_mode": parse_mode,
-                "caption_entities": json.dumps(
-                    caption_entities,
-                    default=pydantic_encoder,
-                )
+                "caption_entities": dumps(caption_entities)
                 if caption_entities
                 else None,
                 "disable_content_type_detection": disable_content_type_detection,
                 "disable_notification": disable_notification,
                 "protect_content": protect_content,
                 "message_effect_id": message_effect_id,
-                "reply_parameters": reply_parameters.json(
-                    exclude_none=True,
-                )
+                "reply_parameters": dumps(reply_parameters)
                 if reply_parameters
                 else None,
-                "reply_markup": reply_markup.json(exclude_none=True)
-                if reply_markup
-                else None,
+                "reply_markup": reply_markup.to_json() if reply_markup else None,
             },
             files={"document": (document_name, document)}
             if not isinstance(document, str)
@@ -363,10 +356,7 @@ class TelegramClient:
                 "message_thread_id": message_thread_id,
                 "caption": caption,
                 "parse_mode": parse_mode,
-                "caption_entities": json.dumps(
-                    caption_entities,
-                    default=pydantic_encoder,
-                )
+                "caption_entities": dumps(caption_entities)
                 if caption_entities
                 else None,
                 "show_caption_above_media": show_caption_above_media,
@@ -374,14 +364,10 @@ class TelegramClient:
                 "disable_notification": disable_notification,
                 "protect_content": protect_content,
                 "message_effect_id": message_effect_id,
-                "reply_parameters": reply_parameters.json(
-                    exclude_none=True,
-                )
+                "reply_parameters": dumps(reply_parameters)
                 if reply_parameters
                 else None,
-                "reply_markup": reply_markup.json(exclude_none=True)
-                if reply_markup
-                else None,
+                "reply_markup": reply_markup.to_json() if reply_markup else None,
             },
             files={"photo": photo} if not isinstance(photo, str) else None,
         )
@@ -423,11 +409,11 @@ class TelegramClient:
             path="/answerInlineQuery",
             params={
                 "inline_query_id": inline_query_id,
-                "results": json.dumps(results, default=pydantic_encoder),
+                "results": dumps(results),
                 "cache_time": cache_time,
                 "is_personal": is_personal,
                 "next_offset": next_offset,
-                "button": button.json(exclude_none=True) if button else None,
+                "button": dumps(button) if button else None,
             },
         )
 
@@ -516,6 +502,30 @@ class TelegramClient:
             },
         )
 
+    @collect_response
+    async def get_user_chat_boosts(
+        self,
+        *,
+        chat_id: Union[int, str],
+        user_id: int,
+    ) -> TelegramAPIGetUserChatBoostsResponse:
+        """Use this method to get the list of boosts added to a chat by a user.
+        Requires administrator rights in the chat. Returns a UserChatBoosts
+        object.
+
+        :param chat_id: Unique identifier for the chat or username of the
+            channel (in the format @channelusername)
+        :param user_id: Unique identifier of the target user
+        """
+
+        return await self.__make_request(
+            path="/getUserChatBoosts",
+            params={
+                "chat_id": chat_id,
+                "user_id": user_id,
+            },
+        )
+
     @collect_response
     async def edit_message_reply_markup(
         self,
@@ -552,9 +562,7 @@ class TelegramClient:
                 "chat_id": chat_id,
                 "message_id": message_id,
                 "inline_message_id": inline_message_id,
-                "reply_markup": reply_markup.json(exclude_none=True)
-                if reply_markup
-                else None,
+                "reply_markup": reply_markup.to_json() if reply_markup else None,
             },
         )
 
@@ -606,18 +614,11 @@ class TelegramClient:
                 "message_id": message_id,
                 "inline_message_id": inline_message_id,
                 "parse_mode": parse_mode,
-                "entities": json.dumps(entities, default=pydantic_encoder)
-                if entities
-                else None,
-                "link_preview_options": json.dumps(
-                    link_preview_options,
-                    default=pydantic_encoder,
-                )
+                "entities": dumps(entities) if entities else None,
+                "link_preview_options": dumps(link_preview_options)
                 if link_preview_options
                 else None,
-                "reply_markup": reply_markup.json(exclude_none=True)
-                if reply_markup
-                else None,
+                "reply_markup": reply_markup.to_json() if reply_markup else None,
             },
         )
 
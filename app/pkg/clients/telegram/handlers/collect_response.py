@@ -1,13 +1,37 @@
 """Collect response from a node and return model or raise ClientError."""
 
 from functools import wraps
+from typing import Any, Callable
 
 import pydantic
+import ujson
+from pydantic.typing import display_as_type
 
+from app.pkg.clients.telegram.models import BaseTelegramClient, prepare_trusted
 from app.pkg.clients.telegram.models.exceptions import ClientExceptionFactory
 from app.pkg.models.base import Model
 
 
+def _build_parser(return_type: Any) -> Callable[[Any], Model]:
+    """Build parser of decoded responses for ``return_type`` once per client
+    method.
+
+    Successful responses come from Telegram itself and follow its schema, so
+    telegram client models are built without validation. Other annotations
+    (e.g. unions) are validated by a parsing model that is created only once.
+    """
+
+    if isinstance(return_type, type) and issubclass(return_type, BaseTelegramClient):
+        prepare_trusted(return_type)
+        return return_type.from_trusted
+
+    parsing_model = pydantic.create_model(
+        f"ParsingModel[{display_as_type(return_type)}]",
+        __root__=(return_type, ...),
+    )
+    return lambda obj: parsing_model.parse_obj(obj).__root__
+
+
 def collect_response(fn):  # noqa: C901
     """Convert response from a node to an annotated model.
 
@@ -29,6 +53,8 @@ def collect_response(fn):  # noqa: C901
         The model that is specified in type hints of `fn`.
     """
 
+    parse = _build_parser(fn.__annotations__["return"])
+
     @wraps(fn)
     async def inner(*args: object, **kwargs: object) -> Model:
         try:
@@ -50,10 +76,7 @@ def collect_response(fn):  # noqa: C901
                 )
 
             try:
-                model = pydantic.parse_obj_as(
-                    fn.__annotations__["return"],
-                    response.json(),
-                )
+                model = parse(ujson.loads(response.content))
             except pydantic.ValidationError as exc:
                 raise ClientExceptionFactory(
                     details=exc,
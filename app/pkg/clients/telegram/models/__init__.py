@@ -1,7 +1,449 @@
 """Telegram client models."""
 
+import sys
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    ForwardRef,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+import pydantic
+import ujson
+from pydantic.error_wrappers import ErrorWrapper
+from pydantic.fields import (
+    SHAPE_LIST,
+    SHAPE_SINGLETON,
+    SHAPE_TUPLE_ELLIPSIS,
+    FieldInfo,
+    ModelField,
+)
+from pydantic.json import pydantic_encoder
+from pydantic.typing import (
+    Annotated,
+    all_literal_values,
+    evaluate_forwardref,
+    get_args,
+    get_origin,
+    is_literal_type,
+    is_union,
+)
+
 from app.pkg.models.base import BaseModel
 
+_Model = TypeVar("_Model", bound=pydantic.BaseModel)
+
+
+_MISSING = object()
+
+#: Tuple[type, ...]: Default values of these types are shared between instances.
+_IMMUTABLE_DEFAULTS = (type(None), bool, int, float, str, bytes, tuple, frozenset)
+
+
+@lru_cache(maxsize=None)
+def _nested_model(field: ModelField) -> Optional[Type[pydantic.BaseModel]]:
+    """Return model class of a plain (not union) model field, if any."""
+
+    type_ = field.type_
+    if (
+        not field.sub_fields
+        and isinstance(type_, type)
+        and issubclass(type_, pydantic.BaseModel)
+    ):
+        return type_
+    return None
+
+
+@lru_cache(maxsize=None)
+def _literal_values(field: ModelField) -> Optional[Dict[Any, Any]]:
+    """Map values of a ``Literal`` field to the constants of its annotation.
+
+    Tags like ``type`` or ``status`` repeat in every payload, mapping them to
+    the constants keeps a single shared string per tag, just like pydantic's
+    literal validator does.
+    """
+
+    if is_literal_type(field.type_):
+        return {value: value for value in all_literal_values(field.type_)}
+    return None
+
+
+@lru_cache(maxsize=None)
+def _union_tags(
+    field: ModelField,
+) -> Optional[Tuple[str, Dict[Any, Type[pydantic.BaseModel]], Optional[type]]]:
+    """Find the tag telling apart members of a union of models, if any.
+
+    The tag is a ``Literal`` field (like ``type``, ``status`` or ``source``)
+    with distinct values in the members. At most one member may declare it
+    without ``Literal``, that member is picked for any other value.
+
+    Returns:
+        Alias of the tag, members by tag value and the member picked for
+        other values, or ``None`` if members can't be told apart by a tag.
+    """
+
+    members = [sub_field.type_ for sub_field in field.sub_fields or ()]
+    if not members or not all(
+        isinstance(member, type) and issubclass(member, pydantic.BaseModel)
+        for member in members
+    ):
+        return None
+
+    names = {
+        name
+        for member in members
+        for name, member_field in member.__fields__.items()
+        if is_literal_type(member_field.type_)
+    }
+    for name in sorted(names):
+        by_value = {}
+        untagged = []
+        for member in members:
+            member_field = member.__fields__.get(name)
+            if member_field is None or not is_literal_type(member_field.type_):
+                untagged.append(member)
+                continue
+            for value in all_literal_values(member_field.type_):
+                by_value.setdefault(value, []).append(member)
+        if len(untagged) > 1 or any(len(tagged) > 1 for tagged in by_value.values()):
+            continue
+        alias = next(
+            member.__fields__[name].alias
+            for member in members
+            if name in member.__fields__
+        )
+        return (
+            alias,
+            {value: tagged[0] for value, tagged in by_value.items()},
+            untagged[0] if untagged else None,
+        )
+    return None
+
+
+@lru_cache(maxsize=None)
+def _layout(
+    model: Type[pydantic.BaseModel],
+) -> Tuple[
+    Dict[str, Tuple[str, ModelField]],
+    Dict[str, Any],
+    Tuple[Tuple[str, ModelField], ...],
+]:
+    """Describe how to construct ``model``, built once per model.
+
+    Most fields of telegram objects are optional and absent from payloads, so
+    their shared defaults are kept in a template that is copied as a whole.
+    Only the few fields without such a default are handled one by one.
+
+    Returns:
+        Fields by alias and name, template of field values in declaration
+        order, and ``(name, field)`` of required fields and of fields whose
+        default must be built for every instance. Those are ``_MISSING`` in
+        the template.
+    """
+
+    by_key = {}
+    template = {}
+    pending = []
+    for name, field in model.__fields__.items():
+        by_key[name] = by_key[field.alias] = (name, field)
+        if (
+            not field.required
+            and field.default_factory is None
+            and isinstance(field.default, _IMMUTABLE_DEFAULTS)
+        ):
+            template[name] = field.default
+        else:
+            template[name] = _MISSING
+            pending.append((name, field))
+    return by_key, template, tuple(pending)
+
+
+@lru_cache(maxsize=None)
+def _interned(model: Type[pydantic.BaseModel]) -> FrozenSet[str]:
+    """Return names of fields of ``model`` whose string values are interned.
+
+    Models list them in their ``_interned_fields`` class attribute.
+    """
+
+    return frozenset(getattr(model, "_interned_fields", ()))
+
+
+@lru_cache(maxsize=None)
+def _shared(
+    model: Type[pydantic.BaseModel],
+) -> Optional[Callable[[Dict[str, Any]], Any]]:
+    """Return the ``_shared_instance`` class method of ``model``, if any.
+
+    Models whose instances are shared (like markers holding no data) return
+    the shared instance for a payload from it, or ``None`` if the payload
+    needs an instance of its own.
+    """
+
+    return getattr(model, "_shared_instance", None)
+
+
+def _construct_member(field: ModelField, value: Any) -> Any:
+    """Build a member of the union of models of ``field`` picked by its tag.
+
+    Returns:
+        Built member or ``_MISSING`` if no member can be picked.
+    """
+
+    if isinstance(value, dict):
+        tags = _union_tags(field)
+        if tags is not None:
+            alias, by_value, default = tags
+            member = by_value.get(value.get(alias), default)
+            if member is not None:
+                return construct_trusted(member, value)
+    return _MISSING
+
+
+def _construct_items(
+    model: Type[pydantic.BaseModel],
+    field: ModelField,
+    value: Iterable[Any],
+) -> Optional[List[Any]]:
+    """Build items of a list or tuple ``field``.
+
+    Returns:
+        Built items or ``None`` if some item can't be built without
+        validation.
+    """
+
+    if is_union(get_origin(field.type_)):
+        # Sub-fields of a sequence of a union are the union members.
+        items = [_construct_member(field, item) for item in value]
+        return None if any(item is _MISSING for item in items) else items
+    sub_field = field.sub_fields[0]
+    return [_construct_value(model, sub_field, item) for item in value]
+
+
+def _construct_value(
+    model: Type[pydantic.BaseModel],
+    field: ModelField,
+    value: Any,
+) -> Any:
+    """Build the value of ``field`` from trusted data without validating it.
+
+    Nested models, lists and tuples of them are constructed recursively,
+    other plain values are kept as is. Members of unions of models are picked
+    by their tag, see :func:`_union_tags`. Other unions fall back to regular
+    field validation, so the resulting model always holds proper instances.
+    """
+
+    if value is None:
+        return None
+
+    if field.shape == SHAPE_SINGLETON:
+        nested = _nested_model(field)
+        if nested is not None and isinstance(value, dict):
+            return construct_trusted(nested, value)
+        if not field.sub_fields:
+            literal_values = _literal_values(field)
+            if literal_values is not None:
+                return literal_values.get(value, value)
+            return value
+        member = _construct_member(field, value)
+        if member is not _MISSING:
+            return member
+
+    elif field.shape == SHAPE_LIST and isinstance(value, list):
+        items = _construct_items(model, field, value)
+        if items is not None:
+            return items
+
+    elif field.shape == SHAPE_TUPLE_ELLIPSIS and isinstance(value, (list, tuple)):
+        items = _construct_items(model, field, value)
+        if items is not None:
+            return tuple(items)
+
+    value, errors = field.validate(value, {}, loc=field.alias, cls=model)
+    if errors:
+        raise pydantic.ValidationError([ErrorWrapper(errors, loc="__root__")], model)
+    return value
+
+
+def construct_trusted(model: Type[_Model], data: Dict[str, Any]) -> _Model:
+    """Build ``model`` from data that already follows its schema.
+
+    Telegram enforces the schema of everything it sends, so validating its
+    payloads again only costs time. Works like
+    :meth:`pydantic.BaseModel.construct`, but also builds nested models and
+    accepts fields by alias.
+
+    String values of fields listed in ``_interned_fields`` of ``model`` are
+    interned, and shared instances are returned for models defining
+    ``_shared_instance``, as validation of the model does.
+
+    Warnings:
+        Validators are not called and required fields are not checked, use it
+        only for payloads received from Telegram itself.
+
+    Args:
+        model: Model class to build.
+        data: Decoded JSON object.
+
+    Returns:
+        Instance of ``model``.
+    """
+
+    shared = _shared(model)
+    if shared is not None:
+        instance = shared(data)
+        if instance is not None:
+            return instance
+
+    by_key, template, pending = _layout(model)
+    interned = _interned(model)
+    values = {}
+    for key, value in data.items():
+        if key in by_key:
+            name, field = by_key[key]
+            if name in interned and isinstance(value, str):
+                values[name] = sys.intern(value)
+            else:
+                values[name] = _construct_value(model, field, value)
+
+    fields_values = template.copy()
+    fields_values.update(values)
+    for name, field in pending:
+        if fields_values[name] is not _MISSING:
+            continue
+        if field.required:
+            del fields_values[name]
+        else:
+            fields_values[name] = field.get_default()
+
+    instance = model.__new__(model)
+    object.__setattr__(instance, "__dict__", fields_values)
+    object.__setattr__(instance, "__fields_set__", set(values))
+    instance._init_private_attributes()  # pylint: disable=protected-access
+    return instance
+
+
+def _discriminator(type_: Any, globalns: Dict[str, Any]) -> Optional[str]:
+    """Return discriminator declared by an ``Annotated`` union in ``type_``."""
+
+    if isinstance(type_, ForwardRef):
+        type_ = evaluate_forwardref(type_, globalns, None)
+    if get_origin(type_) is Annotated:
+        for meta in get_args(type_)[1:]:
+            if isinstance(meta, FieldInfo) and meta.discriminator is not None:
+                return meta.discriminator
+    for arg in get_args(type_):
+        discriminator = _discriminator(arg, globalns)
+        if discriminator is not None:
+            return discriminator
+    return None
+
+
+def resolve_discriminators(model: Type[pydantic.BaseModel]) -> None:
+    """Apply discriminators of ``Annotated`` unions to fields of ``model``.
+
+    Pydantic v1 reads them only from annotations it sees when the model is
+    created, so unions referenced by a forward reference, inside
+    ``Optional`` or inside a list would be validated by trying every member
+    in turn. Call it once forward references of ``model`` are resolved.
+    """
+
+    globalns = sys.modules[model.__module__].__dict__
+    fields = list(model.__fields__.values())
+    while fields:
+        field = fields.pop()
+        fields.extend(field.sub_fields or ())
+        if field.discriminator_key is not None or not is_union(
+            get_origin(field.type_),
+        ):
+            continue
+        discriminator = _discriminator(field.outer_type_, globalns)
+        if discriminator is not None:
+            field.discriminator_key = discriminator
+            field.prepare_discriminated_union_sub_fields()
+
+
+def prepare_trusted(model: Type[pydantic.BaseModel]) -> None:
+    """Build everything :func:`construct_trusted` caches for ``model`` ahead
+    of time.
+
+    Called at import, so the caches are filled before the application forks
+    its workers and are shared by them instead of being built in every
+    worker on first use. Forward references of ``model`` must be resolved.
+    """
+
+    _layout(model)
+    _interned(model)
+    _shared(model)
+    _aliases(model)
+    fields = list(model.__fields__.values())
+    while fields:
+        field = fields.pop()
+        _nested_model(field)
+        _literal_values(field)
+        _union_tags(field)
+        fields.extend(field.sub_fields or ())
+
+
+@lru_cache(maxsize=None)
+def _aliases(model: Type[pydantic.BaseModel]) -> Tuple[Tuple[str, str], ...]:
+    """Return ``(name, alias)`` of every field of ``model``, built once per
+    model."""
+
+    return tuple((name, field.alias) for name, field in model.__fields__.items())
+
+
+def shallow_dict(instance: pydantic.BaseModel) -> Dict[str, Any]:
+    """Return set fields of ``instance`` by alias, like ``.dict(by_alias=True,
+    exclude_none=True)`` but without converting nested values.
+
+    Meant as ``default`` of JSON encoders, which call it again for nested
+    models, so each model is visited only once instead of being converted by
+    the generic recursive ``.dict()``.
+    """
+
+    values = instance.__dict__
+    return {
+        alias: values[name]
+        for name, alias in _aliases(type(instance))
+        if values[name] is not None
+    }
+
+
+def _encode(value: Any) -> Any:
+    """Encode objects unknown to ``ujson``, dropping unset optional fields of
+    models like ``.json(exclude_none=True)`` does."""
+
+    if isinstance(value, pydantic.BaseModel):
+        return shallow_dict(value)
+    return pydantic_encoder(value)
+
+
+def dumps(value: Any) -> str:
+    """Serialize a bot API request parameter to JSON with ``ujson``.
+
+    Models are encoded by :func:`shallow_dict`, so the result is the same as
+    of ``.json(exclude_none=True)``, but nested models are not converted to
+    dicts first.
+    """
+
+    return ujson.dumps(value, default=_encode, escape_forward_slashes=False)
+
 
 class BaseTelegramClient(BaseModel):
     """Base model for all telegram client models."""
+
+    @classmethod
+    def from_trusted(cls: Type[_Model], data: Dict[str, Any]) -> _Model:
+        """Build model from a trusted Telegram payload, see
+        :func:`construct_trusted`."""
+
+        return construct_trusted(cls, data)
@@ -1,8 +1,44 @@
 """Enums for TelegramBot."""
 
+from enum import IntFlag
+
 from app.pkg.models.base import BaseEnum
 
 
 class Methods(BaseEnum):  # pylint: disable=C0115
     GET: str = "GET"
     POST: str = "POST"
+
+
+class ChatRights(IntFlag):
+    """Rights of a chat member or administrator, one bit per ``can_*`` flag
+    of telegram objects.
+
+    Rights of two objects are compared with a single ``^``.
+    """
+
+    MANAGE_CHAT = 1 << 0
+    DELETE_MESSAGES = 1 << 1
+    MANAGE_VIDEO_CHATS = 1 << 2
+    RESTRICT_MEMBERS = 1 << 3
+    PROMOTE_MEMBERS = 1 << 4
+    CHANGE_INFO = 1 << 5
+    INVITE_USERS = 1 << 6
+    POST_STORIES = 1 << 7
+    EDIT_STORIES = 1 << 8
+    DELETE_STORIES = 1 << 9
+    POST_MESSAGES = 1 << 10
+    EDIT_MESSAGES = 1 << 11
+    PIN_MESSAGES = 1 << 12
+    MANAGE_TOPICS = 1 << 13
+    BE_EDITED = 1 << 14
+    SEND_MESSAGES = 1 << 15
+    SEND_AUDIOS = 1 << 16
+    SEND_DOCUMENTS = 1 << 17
+    SEND_PHOTOS = 1 << 18
+    SEND_VIDEOS = 1 << 19
+    SEND_VIDEO_NOTES = 1 << 20
+    SEND_VOICE_NOTES = 1 << 21
+    SEND_POLLS = 1 << 22
+    SEND_OTHER_MESSAGES = 1 << 23
+    ADD_WEB_PAGE_PREVIEWS = 1 << 24
@@ -1,11 +1,292 @@
-"""Request models for telegram webhook."""
+"""Request models for telegram webhook.
+
+Dates (``date``, ``add_date``, ``expire_date``, ``until_date`` and so on) are
+kept as received, as ``int`` Unix timestamps in seconds. Use
+:func:`to_datetime` where a ``datetime`` is needed.
+"""
+
+import sys
+from array import array
+from bisect import bisect_right
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import (
+    Annotated,
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    FrozenSet,
+    List,
+    Literal,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    get_args,
+)
+
+import ujson
+from pydantic import (
+    BaseModel,
+    Extra,
+    Field,
+    PrivateAttr,
+    ValidationError,
+    conint,
+    parse_obj_as,
+    root_validator,
+    validator,
+)
+from pydantic.error_wrappers import ErrorWrapper
+from pydantic.errors import IntegerError
+from pydantic.validators import int_validator, str_validator
+
+from app.pkg.clients.telegram.models import (
+    construct_trusted,
+    dumps,
+    prepare_trusted,
+    resolve_discriminators,
+)
+from app.pkg.clients.telegram.models.enums import ChatRights
+
+_Model = TypeVar("_Model", bound="_TelegramModel")
+
+
+def _intern_string(cls, value: Any) -> Any:  # pylint: disable=unused-argument
+    """Intern string values, so equal identifiers share one object.
+
+    Interned strings are released once nothing references them anymore,
+    so the pool does not grow with the amount of processed updates.
+    """
+
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class ChatId:
+    """Unique identifier (``int``) or username (``str``) of a chat.
+
+    Validated like ``Union[int, str]``, but identifiers, which are ints in
+    almost every payload, are returned right away instead of going through
+    validation of union members.
+    """
+
+    @classmethod
+    def __get_validators__(cls):
+        yield cls.validate
+
+    @classmethod
+    def __modify_schema__(cls, field_schema: Dict[str, Any]) -> None:
+        field_schema.update(anyOf=[{"type": "integer"}, {"type": "string"}])
+
+    @classmethod
+    def validate(cls, value: Any) -> Union[int, str]:
+        """Validate chat identifier or username."""
+
+        if type(value) is int:  # pylint: disable=unidiomatic-typecheck
+            return value
+        try:
+            return int_validator(value)
+        except IntegerError:
+            return str_validator(value)
+
+
+@lru_cache(maxsize=65536)
+def to_datetime(timestamp: int) -> datetime:
+    """Convert Unix timestamp of a telegram object to an aware UTC
+    ``datetime``.
+
+    Updates of a chat carry the same few timestamps over and over, so
+    conversions are cached.
+    """
+
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc)
+
+
+def _json_dumps(
+    value: Any,
+    *,
+    default: Callable[[Any], Any],
+    **kwargs: Any,
+) -> str:
+    """Serialize models to JSON with ``ujson`` instead of stdlib ``json``."""
+
+    return ujson.dumps(
+        value,
+        default=default,
+        escape_forward_slashes=False,
+        **kwargs,
+    )
+
+
+class _TelegramModel(BaseModel):
+    """Base model for all telegram objects."""
+
+    class Config:
+        """Configuration of telegram models."""
+
+        #: str: Fields unknown to the model (e.g. added in newer bot API
+        #  versions) are dropped.
+        extra = Extra.ignore
+        #: bool: Aliased fields, like ``from_``, may be set by field name.
+        allow_population_by_field_name = True
+        #: str: Model instances passed as field values (e.g. a keyboard
+        #  passed to a message) are kept as is instead of being copied.
+        copy_on_model_validation = "none"
+        #: bool: Model instances passed to union fields are kept as they are
+        #  when they belong to the union, instead of being converted to the
+        #  first member that accepts their fields.
+        smart_union = True
+        #: Callable: JSON decoder used by ``parse_raw``.
+        json_loads = ujson.loads
+        #: Callable: JSON encoder used by ``json``.
+        json_dumps = _json_dumps
+
+    #: Tuple[str, ...]: Names of string fields whose values repeat across
+    #  payloads (identifiers, types, codes). Their values are interned, so
+    #  equal values share one object, both on validation and on trusted
+    #  construction.
+    _interned_fields: ClassVar[Tuple[str, ...]] = ()
 
-from typing import Any, List, Optional, Union
+    @root_validator(pre=True, allow_reuse=True)
+    def _intern_fields(  # pylint: disable=no-self-argument
+        cls,
+        values: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """Intern values of fields listed in ``_interned_fields``."""
+
+        if not cls._interned_fields:
+            return values
+        values = dict(values)
+        for name in cls._interned_fields:
+            for key in {name, cls.__fields__[name].alias}:
+                if key in values:
+                    values[key] = _intern_string(cls, values[key])
+        return values
+
+    @classmethod
+    def from_bytes(
+        cls: Type[_Model],
+        raw: bytes,
+        *,
+        trusted: bool = False,
+    ) -> _Model:
+        """Decode and validate model from a raw JSON body.
+
+        Unlike ``parse_raw``, the body is passed to the decoder as is,
+        without decoding it to ``str`` first.
+
+        Args:
+            raw: Raw JSON body.
+            trusted: The body is known to be sent by Telegram itself (e.g.
+                its secret token is verified), so the model is built by
+                :meth:`from_trusted` without validation.
+
+        Raises:
+            ValidationError: if body is not a valid JSON or does not match
+                the model.
+        """
 
-from pydantic import BaseModel, Field
+        try:
+            obj = cls.__config__.json_loads(raw)
+        except (ValueError, TypeError) as exc:
+            raise ValidationError([ErrorWrapper(exc, loc="__root__")], cls) from exc
+        if trusted and isinstance(obj, dict):
+            return cls.from_trusted(obj)
+        return cls.parse_obj(obj)
 
+    @classmethod
+    def from_trusted(cls: Type[_Model], data: Dict[str, Any]) -> _Model:
+        """Build model from a trusted Telegram payload, see
+        :func:`~app.pkg.clients.telegram.models.construct_trusted`."""
+
+        return construct_trusted(cls, data)
+
+
+class _MarkerModel(_TelegramModel):
+    """Base model for service objects that currently hold no information.
+
+    Such objects have no fields or only a constant tag, so all instances are
+    equal and one shared instance is returned wherever the object is received
+    instead of validating a new one.
+    """
+
+    class Config:
+        """Configuration of marker telegram models."""
+
+        #: bool: Instances are shared, so they are immutable.
+        frozen = True
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def shared(cls: Type[_Model]) -> _Model:
+        """Return shared instance of the marker object."""
+
+        return cls()
+
+    @classmethod
+    def _shared_instance(cls: Type[_Model], data: Dict[str, Any]) -> Optional[_Model]:
+        """Return the shared instance for an object with the same tag, used
+        by validation and by trusted construction alike."""
+
+        if all(
+            data.get(field.alias, field.default) == field.default
+            for field in cls.__fields__.values()
+        ):
+            return cls.shared()
+        return None
 
-class Update(BaseModel):
+    @classmethod
+    def validate(cls: Type[_Model], value: Any) -> _Model:
+        """Validate field value, returning the shared instance for any
+        object with the same tag."""
+
+        if isinstance(value, dict):
+            shared = cls._shared_instance(value)
+            if shared is not None:
+                return shared
+        return super().validate(value)
+
+
+class _SharedModel(_TelegramModel):
+    """Base model for objects sent in requests whose instances are shared,
+    like bot command scopes and menu buttons, so they are immutable."""
+
+    class Config:
+        """Configuration of shared telegram models."""
+
+        #: bool: Instances are shared, so they are immutable.
+        frozen = True
+
+
+class _KeyedModel(_TelegramModel):
+    """Base model for objects identified by a single field.
+
+    Such objects are used as keys of caches and sets, so they are immutable
+    and compared and hashed by the identifying field only, instead of by all
+    of their fields.
+    """
+
+    #: str: Name of the field identifying the object.
+    _key: ClassVar[str]
+
+    class Config:
+        """Configuration of keyed telegram models."""
+
+        #: bool: Instances are immutable and hashable.
+        frozen = True
+
+    def __hash__(self) -> int:
+        return hash(getattr(self, self._key))
+
+    def __eq__(self, other: Any) -> bool:
+        key = self._key
+        return type(other) is type(self) and getattr(other, key) == getattr(self, key)
+
+
+class Update(_TelegramModel):
     """This object represents an incoming update.At most one of the optional
     parameters can be present in any given update."""
 
@@ -181,7 +462,7 @@ class Update(BaseModel):
     """
 
 
-class WebhookInfo(BaseModel):
+class WebhookInfo(_TelegramModel):
     """Describes the current status of a webhook."""
 
     url: str
@@ -236,7 +517,7 @@ class WebhookInfo(BaseModel):
     """
 
 
-class User(BaseModel):
+class User(_TelegramModel):
     """This object represents a Telegram user or bot."""
 
     id: int
@@ -312,9 +593,11 @@ class User(BaseModel):
     """
 
 
-class Chat(BaseModel):
+class Chat(_TelegramModel):
     """This object represents a chat."""
 
+    _interned_fields = ("type",)
+
     id: int
     """Unique identifier for this chat.
 
@@ -360,9 +643,11 @@ class Chat(BaseModel):
     """
 
 
-class ChatFullInfo(BaseModel):
+class ChatFullInfo(_TelegramModel):
     """This object contains full information about a chat."""
 
+    _interned_fields = ("type",)
+
     id: int
     """Unique identifier for this chat.
 
@@ -659,7 +944,7 @@ class ChatFullInfo(BaseModel):
     """
 
 
-class Message(BaseModel):
+class Message(_TelegramModel):
     """This object represents a message."""
 
     message_id: int
@@ -1223,14 +1508,14 @@ class Message(BaseModel):
     """
 
 
-class MessageId(BaseModel):
+class MessageId(_TelegramModel):
     """This object represents a unique message identifier."""
 
     message_id: int
     """Unique message identifier."""
 
 
-class InaccessibleMessage(BaseModel):
+class InaccessibleMessage(_TelegramModel):
     """This object describes a message that was deleted or is otherwise
     inaccessible to the bot."""
 
@@ -1240,7 +1525,7 @@ class InaccessibleMessage(BaseModel):
     message_id: int
     """Unique message identifier inside the chat."""
 
-    date: int
+    date: Literal[0]
     """Always 0.
 
     The field can be used to differentiate regular and inaccessible
@@ -1248,12 +1533,14 @@ class InaccessibleMessage(BaseModel):
     """
 
 
-class MessageEntity(BaseModel):
+class MessageEntity(_TelegramModel):
     """This object represents one special entity in a text message.
 
     For example, hashtags, usernames, URLs, etc.
     """
 
+    _interned_fields = ("type",)
+
     type: str
     """Type of the entity.
 
@@ -1303,7 +1590,7 @@ class MessageEntity(BaseModel):
     """
 
 
-class TextQuote(BaseModel):
+class TextQuote(_TelegramModel):
     """This object contains information about the quoted part of a message that
     is replied to by the given message."""
 
@@ -1330,8 +1617,39 @@ class TextQuote(BaseModel):
     Otherwise, the quote was added automatically by the server.
     """
 
+    _text_utf16: Optional[bytes] = PrivateAttr(default=None)
+
+    @property
+    def text_utf16(self) -> bytes:
+        """Quote text in UTF-16-LE, the encoding telegram offsets refer to.
+
+        Encoded lazily on first access and kept for the model lifetime.
+        """
+
+        if self._text_utf16 is None:
+            self._text_utf16 = self.text.encode("utf-16-le")
+        return self._text_utf16
+
+    def locate(self, message_utf16: bytes) -> int:
+        """Find the quote in the UTF-16-LE encoded text of the original
+        message.
+
+        Args:
+            message_utf16: Text of the original message, encoded once by
+                the caller with ``text.encode("utf-16-le")``.
+
+        Returns:
+            Offset of the quote in UTF-16 code units or ``-1`` if the
+            quote is not a part of the message.
+        """
 
-class ExternalReplyInfo(BaseModel):
+        offset = message_utf16.find(self.text_utf16)
+        while offset > 0 and offset % 2:
+            offset = message_utf16.find(self.text_utf16, offset + 1)
+        return offset // 2 if offset >= 0 else -1
+
+
+class ExternalReplyInfo(_TelegramModel):
     """This object contains information about a message that is being replied
     to, which may come from another chat or forum topic."""
 
@@ -1481,14 +1799,14 @@ class ExternalReplyInfo(BaseModel):
     """
 
 
-class ReplyParameters(BaseModel):
+class ReplyParameters(_TelegramModel):
     """Describes reply parameters for the message that is being sent."""
 
     message_id: int
     """Identifier of the message that will be replied to in the current chat,
     or in the chat chat_id if it is specified."""
 
-    chat_id: Optional[Union[int, str]] = None
+    chat_id: Optional[ChatId] = None
     """Optional.
 
     If the message to be replied to is from a different chat, unique
@@ -1537,10 +1855,10 @@ class ReplyParameters(BaseModel):
     """
 
 
-class MessageOriginUser(BaseModel):
+class MessageOriginUser(_TelegramModel):
     """The message was originally sent by a known user."""
 
-    type: str
+    type: Literal["user"]
     """Type of the message origin, always “user”"""
 
     date: int
@@ -1550,10 +1868,10 @@ class MessageOriginUser(BaseModel):
     """User that sent the message originally."""
 
 
-class MessageOriginHiddenUser(BaseModel):
+class MessageOriginHiddenUser(_TelegramModel):
     """The message was originally sent by an unknown user."""
 
-    type: str
+    type: Literal["hidden_user"]
     """Type of the message origin, always “hidden_user”"""
 
     date: int
@@ -1563,10 +1881,10 @@ class MessageOriginHiddenUser(BaseModel):
     """Name of the user that sent the message originally."""
 
 
-class MessageOriginChat(BaseModel):
+class MessageOriginChat(_TelegramModel):
     """The message was originally sent on behalf of a chat to a group chat."""
 
-    type: str
+    type: Literal["chat"]
     """Type of the message origin, always “chat”"""
 
     date: int
@@ -1583,10 +1901,10 @@ class MessageOriginChat(BaseModel):
     """
 
 
-class MessageOriginChannel(BaseModel):
+class MessageOriginChannel(_TelegramModel):
     """The message was originally sent to a channel chat."""
 
-    type: str
+    type: Literal["channel"]
     """Type of the message origin, always “channel”"""
 
     date: int
@@ -1605,7 +1923,17 @@ class MessageOriginChannel(BaseModel):
     """
 
 
-class PhotoSize(BaseModel):
+class _FileModel(_TelegramModel):
+    """Base model for files stored on Telegram servers.
+
+    The same files are sent over and over, so their identifiers are
+    interned.
+    """
+
+    _interned_fields = ("file_id", "file_unique_id")
+
+
+class PhotoSize(_FileModel):
     """This object represents one size of a photo or a file / sticker
     thumbnail."""
 
@@ -1633,7 +1961,7 @@ class PhotoSize(BaseModel):
     """
 
 
-class Animation(BaseModel):
+class Animation(_FileModel):
     """This object represents an animation file (GIF or H.264/MPEG-4 AVC video
     without sound)."""
 
@@ -1685,7 +2013,7 @@ class Animation(BaseModel):
     """
 
 
-class Audio(BaseModel):
+class Audio(_FileModel):
     """This object represents an audio file to be treated as music by the
     Telegram clients."""
 
@@ -1743,7 +2071,7 @@ class Audio(BaseModel):
     """
 
 
-class Document(BaseModel):
+class Document(_FileModel):
     """This object represents a general file (as opposed to photos, voice
     messages and audio files)."""
 
@@ -1786,7 +2114,7 @@ class Document(BaseModel):
     """
 
 
-class Story(BaseModel):
+class Story(_TelegramModel):
     """This object represents a story."""
 
     chat: "Chat"
@@ -1796,7 +2124,7 @@ class Story(BaseModel):
     """Unique identifier for the story in the chat."""
 
 
-class Video(BaseModel):
+class Video(_FileModel):
     """This object represents a video file."""
 
     file_id: str
@@ -1847,7 +2175,7 @@ class Video(BaseModel):
     """
 
 
-class VideoNote(BaseModel):
+class VideoNote(_FileModel):
     """This object represents a video message (available in Telegram apps as of
     v.4.0)."""
 
@@ -1882,7 +2210,7 @@ class VideoNote(BaseModel):
     """
 
 
-class Voice(BaseModel):
+class Voice(_FileModel):
     """This object represents a voice note."""
 
     file_id: str
@@ -1915,7 +2243,7 @@ class Voice(BaseModel):
     """
 
 
-class PaidMediaInfo(BaseModel):
+class PaidMediaInfo(_TelegramModel):
     """Describes the paid media added to a message."""
 
     star_count: int
@@ -1926,10 +2254,10 @@ class PaidMediaInfo(BaseModel):
     """Information about the paid media."""
 
 
-class PaidMediaPreview(BaseModel):
+class PaidMediaPreview(_TelegramModel):
     """The paid media isn't available before the payment."""
 
-    type: str
+    type: Literal["preview"]
     """Type of the paid media, always “preview”"""
 
     width: Optional[int] = None
@@ -1951,27 +2279,27 @@ class PaidMediaPreview(BaseModel):
     """
 
 
-class PaidMediaPhoto(BaseModel):
+class PaidMediaPhoto(_TelegramModel):
     """The paid media is a photo."""
 
-    type: str
+    type: Literal["photo"]
     """Type of the paid media, always “photo”"""
 
     photo: List["PhotoSize"]
     """The photo."""
 
 
-class PaidMediaVideo(BaseModel):
+class PaidMediaVideo(_TelegramModel):
     """The paid media is a video."""
 
-    type: str
+    type: Literal["video"]
     """Type of the paid media, always “video”"""
 
     video: "Video"
     """The video."""
 
 
-class Contact(BaseModel):
+class Contact(_TelegramModel):
     """This object represents a phone contact."""
 
     phone_number: str
@@ -2003,7 +2331,7 @@ class Contact(BaseModel):
     """
 
 
-class Dice(BaseModel):
+class Dice(_TelegramModel):
     """This object represents an animated emoji that displays a random
     value."""
 
@@ -2015,7 +2343,7 @@ class Dice(BaseModel):
     base emoji, 1-64 for “” base emoji."""
 
 
-class PollOption(BaseModel):
+class PollOption(_TelegramModel):
     """This object contains information about one answer option in a poll."""
 
     text: str
@@ -2032,7 +2360,7 @@ class PollOption(BaseModel):
     """
 
 
-class InputPollOption(BaseModel):
+class InputPollOption(_TelegramModel):
     """This object contains information about one answer option in a poll to be
     sent."""
 
@@ -2054,7 +2382,7 @@ class InputPollOption(BaseModel):
     """
 
 
-class PollAnswer(BaseModel):
+class PollAnswer(_TelegramModel):
     """This object represents an answer of a user in a non-anonymous poll."""
 
     poll_id: str
@@ -2081,7 +2409,7 @@ class PollAnswer(BaseModel):
     """
 
 
-class Poll(BaseModel):
+class Poll(_TelegramModel):
     """This object contains information about a poll."""
 
     id: str
@@ -2151,7 +2479,7 @@ class Poll(BaseModel):
     """
 
 
-class Location(BaseModel):
+class Location(_TelegramModel):
     """This object represents a point on the map."""
 
     latitude: float
@@ -2189,7 +2517,7 @@ class Location(BaseModel):
     """
 
 
-class Venue(BaseModel):
+class Venue(_TelegramModel):
     """This object represents a venue."""
 
     location: "Location"
@@ -2231,7 +2559,7 @@ class Venue(BaseModel):
     """
 
 
-class WebAppData(BaseModel):
+class WebAppData(_TelegramModel):
     """Describes data sent from a Web App to the bot."""
 
     data: str
@@ -2247,7 +2575,7 @@ class WebAppData(BaseModel):
     """
 
 
-class ProximityAlertTriggered(BaseModel):
+class ProximityAlertTriggered(_TelegramModel):
     """This object represents the content of a service message, sent whenever a
     user in the chat triggers a proximity alert set by another user."""
 
@@ -2261,7 +2589,7 @@ class ProximityAlertTriggered(BaseModel):
     """The distance between the users."""
 
 
-class MessageAutoDeleteTimerChanged(BaseModel):
+class MessageAutoDeleteTimerChanged(_TelegramModel):
     """This object represents a service message about a change in auto-delete
     timer settings."""
 
@@ -2269,7 +2597,7 @@ class MessageAutoDeleteTimerChanged(BaseModel):
     """New auto-delete time for messages in the chat; in seconds."""
 
 
-class ChatBoostAdded(BaseModel):
+class ChatBoostAdded(_TelegramModel):
     """This object represents a service message about a user boosting a
     chat."""
 
@@ -2277,20 +2605,20 @@ class ChatBoostAdded(BaseModel):
     """Number of boosts added by the user."""
 
 
-class BackgroundFillSolid(BaseModel):
+class BackgroundFillSolid(_TelegramModel):
     """The background is filled using the selected color."""
 
-    type: str
+    type: Literal["solid"]
     """Type of the background fill, always “solid”"""
 
     color: int
     """The color of the background fill in the RGB24 format."""
 
 
-class BackgroundFillGradient(BaseModel):
+class BackgroundFillGradient(_TelegramModel):
     """The background is a gradient fill."""
 
-    type: str
+    type: Literal["gradient"]
     """Type of the background fill, always “gradient”"""
 
     top_color: int
@@ -2303,11 +2631,11 @@ class BackgroundFillGradient(BaseModel):
     """Clockwise rotation angle of the background fill in degrees; 0-359."""
 
 
-class BackgroundFillFreeformGradient(BaseModel):
+class BackgroundFillFreeformGradient(_TelegramModel):
     """The background is a freeform gradient that rotates after every message
     in the chat."""
 
-    type: str
+    type: Literal["freeform_gradient"]
     """Type of the background fill, always “freeform_gradient”"""
 
     colors: List[int]
@@ -2315,10 +2643,26 @@ class BackgroundFillFreeformGradient(BaseModel):
     gradient in the RGB24 format."""
 
 
-class BackgroundTypeFill(BaseModel):
+def apply_dimming(colors: List[int], dimming: int) -> List[int]:
+    """Dim RGB24 colors by ``dimming`` percent, as dark themes do.
+
+    Every channel is scaled with plain integer arithmetic on the packed
+    value, so no intermediate tuples are created per color.
+    """
+
+    scale = 100 - dimming
+    return [
+        ((color >> 16 & 0xFF) * scale // 100) << 16
+        | ((color >> 8 & 0xFF) * scale // 100) << 8
+        | (color & 0xFF) * scale // 100
+        for color in colors
+    ]
+
+
+class BackgroundTypeFill(_TelegramModel):
     """The background is automatically filled based on the selected colors."""
 
-    type: str
+    type: Literal["fill"]
     """Type of the background, always “fill”"""
 
     fill: "BackgroundFill"
@@ -2327,11 +2671,24 @@ class BackgroundTypeFill(BaseModel):
     dark_theme_dimming: int
     """Dimming of the background in dark themes, as a percentage; 0-100."""
 
+    def dark_theme_colors(self) -> List[int]:
+        """Colors of the background fill with ``dark_theme_dimming``
+        applied."""
+
+        fill = self.fill
+        if isinstance(fill, BackgroundFillSolid):
+            colors = [fill.color]
+        elif isinstance(fill, BackgroundFillGradient):
+            colors = [fill.top_color, fill.bottom_color]
+        else:
+            colors = fill.colors
+        return apply_dimming(colors, self.dark_theme_dimming)
+
 
-class BackgroundTypeWallpaper(BaseModel):
+class BackgroundTypeWallpaper(_TelegramModel):
     """The background is a wallpaper in the JPEG format."""
 
-    type: str
+    type: Literal["wallpaper"]
     """Type of the background, always “wallpaper”"""
 
     document: "Document"
@@ -2354,14 +2711,14 @@ class BackgroundTypeWallpaper(BaseModel):
     """
 
 
-class BackgroundTypePattern(BaseModel):
+class BackgroundTypePattern(_TelegramModel):
     """The background is a PNG or TGV (gzipped subset of SVG with MIME type.
 
     “application/x-tgwallpattern”) pattern to be combined with the
     background fill chosen by the user.
     """
 
-    type: str
+    type: Literal["pattern"]
     """Type of the background, always “pattern”"""
 
     document: "Document"
@@ -2389,24 +2746,24 @@ class BackgroundTypePattern(BaseModel):
     """
 
 
-class BackgroundTypeChatTheme(BaseModel):
+class BackgroundTypeChatTheme(_TelegramModel):
     """The background is taken directly from a built-in chat theme."""
 
-    type: str
+    type: Literal["chat_theme"]
     """Type of the background, always “chat_theme”"""
 
     theme_name: str
     """Name of the chat theme, which is usually an emoji."""
 
 
-class ChatBackground(BaseModel):
+class ChatBackground(_TelegramModel):
     """This object represents a chat background."""
 
     type: "BackgroundType"
     """Type of the background."""
 
 
-class ForumTopicCreated(BaseModel):
+class ForumTopicCreated(_TelegramModel):
     """This object represents a service message about a new forum topic created
     in the chat."""
 
@@ -2423,7 +2780,7 @@ class ForumTopicCreated(BaseModel):
     """
 
 
-class ForumTopicClosed(BaseModel):
+class ForumTopicClosed(_MarkerModel):
     """This object represents a service message about a forum topic closed in
     the chat.
 
@@ -2431,7 +2788,7 @@ class ForumTopicClosed(BaseModel):
     """
 
 
-class ForumTopicEdited(BaseModel):
+class ForumTopicEdited(_TelegramModel):
     """This object represents a service message about an edited forum topic."""
 
     name: Optional[str] = None
@@ -2448,7 +2805,7 @@ class ForumTopicEdited(BaseModel):
     """
 
 
-class ForumTopicReopened(BaseModel):
+class ForumTopicReopened(_MarkerModel):
     """This object represents a service message about a forum topic reopened in
     the chat.
 
@@ -2456,7 +2813,7 @@ class ForumTopicReopened(BaseModel):
     """
 
 
-class GeneralForumTopicHidden(BaseModel):
+class GeneralForumTopicHidden(_MarkerModel):
     """This object represents a service message about General forum topic
     hidden in the chat.
 
@@ -2464,7 +2821,7 @@ class GeneralForumTopicHidden(BaseModel):
     """
 
 
-class GeneralForumTopicUnhidden(BaseModel):
+class GeneralForumTopicUnhidden(_MarkerModel):
     """This object represents a service message about General forum topic
     unhidden in the chat.
 
@@ -2472,10 +2829,12 @@ class GeneralForumTopicUnhidden(BaseModel):
     """
 
 
-class SharedUser(BaseModel):
+class SharedUser(_KeyedModel):
     """This object contains information about a user that was shared with the
     bot using a KeyboardButtonRequestUsers button."""
 
+    _key = "user_id"
+
     user_id: int
     """Identifier of the shared user.
 
@@ -2506,7 +2865,7 @@ class SharedUser(BaseModel):
     Username of the user, if the username was requested by the bot
     """
 
-    photo: Optional[List["PhotoSize"]] = None
+    photo: Optional[Tuple["PhotoSize", ...]] = None
     """Optional.
 
     Available sizes of the chat photo, if the photo was requested by the
@@ -2514,21 +2873,23 @@ class SharedUser(BaseModel):
     """
 
 
-class UsersShared(BaseModel):
+class UsersShared(_TelegramModel):
     """This object contains information about the users whose identifiers were
     shared with the bot using a KeyboardButtonRequestUsers button."""
 
     request_id: int
     """Identifier of the request."""
 
-    users: List["SharedUser"]
+    users: Tuple["SharedUser", ...]
     """Information about users shared with the bot."""
 
 
-class ChatShared(BaseModel):
+class ChatShared(_KeyedModel):
     """This object contains information about a chat that was shared with the
     bot using a KeyboardButtonRequestChat button."""
 
+    _key = "chat_id"
+
     request_id: int
     """Identifier of the request."""
 
@@ -2557,7 +2918,7 @@ class ChatShared(BaseModel):
     available.
     """
 
-    photo: Optional[List["PhotoSize"]] = None
+    photo: Optional[Tuple["PhotoSize", ...]] = None
     """Optional.
 
     Available sizes of the chat photo, if the photo was requested by the
@@ -2565,7 +2926,7 @@ class ChatShared(BaseModel):
     """
 
 
-class WriteAccessAllowed(BaseModel):
+class WriteAccessAllowed(_TelegramModel):
     """This object represents a service message about a user allowing a bot to
     write messages after adding it to the attachment menu, launching a Web App
     from a link, or accepting an explicit request from a Web App sent by the
@@ -2593,7 +2954,7 @@ class WriteAccessAllowed(BaseModel):
     """
 
 
-class VideoChatScheduled(BaseModel):
+class VideoChatScheduled(_TelegramModel):
     """This object represents a service message about a video chat scheduled in
     the chat."""
 
@@ -2602,7 +2963,7 @@ class VideoChatScheduled(BaseModel):
     started by a chat administrator."""
 
 
-class VideoChatStarted(BaseModel):
+class VideoChatStarted(_MarkerModel):
     """This object represents a service message about a video chat started in
     the chat.
 
@@ -2610,7 +2971,7 @@ class VideoChatStarted(BaseModel):
     """
 
 
-class VideoChatEnded(BaseModel):
+class VideoChatEnded(_TelegramModel):
     """This object represents a service message about a video chat ended in the
     chat."""
 
@@ -2618,15 +2979,15 @@ class VideoChatEnded(BaseModel):
     """Video chat duration in seconds."""
 
 
-class VideoChatParticipantsInvited(BaseModel):
+class VideoChatParticipantsInvited(_TelegramModel):
     """This object represents a service message about new members invited to a
     video chat."""
 
-    users: List["User"]
+    users: Tuple["User", ...]
     """New members that were invited to the video chat."""
 
 
-class GiveawayCreated(BaseModel):
+class GiveawayCreated(_MarkerModel):
     """This object represents a service message about the creation of a
     scheduled giveaway.
 
@@ -2634,10 +2995,10 @@ class GiveawayCreated(BaseModel):
     """
 
 
-class Giveaway(BaseModel):
+class Giveaway(_TelegramModel):
     """This object represents a message about a scheduled giveaway."""
 
-    chats: List["Chat"]
+    chats: Tuple["Chat", ...]
     """The list of chats which the user must join to participate in the
     giveaway."""
 
@@ -2668,7 +3029,7 @@ class Giveaway(BaseModel):
     Description of additional giveaway prize
     """
 
-    country_codes: Optional[List[str]] = None
+    country_codes: Optional[Tuple[str, ...]] = None
     """Optional.
 
     A list of two-letter ISO 3166-1 alpha-2 country codes indicating the
@@ -2686,7 +3047,7 @@ class Giveaway(BaseModel):
     """
 
 
-class GiveawayWinners(BaseModel):
+class GiveawayWinners(_TelegramModel):
     """This object represents a message about the completion of a giveaway with
     public winners."""
 
@@ -2703,7 +3064,7 @@ class GiveawayWinners(BaseModel):
     winner_count: int
     """Total number of winners in the giveaway."""
 
-    winners: List["User"]
+    winners: Tuple["User", ...]
     """List of up to 100 winners of the giveaway."""
 
     additional_chat_count: Optional[int] = None
@@ -2747,7 +3108,7 @@ class GiveawayWinners(BaseModel):
     """
 
 
-class GiveawayCompleted(BaseModel):
+class GiveawayCompleted(_TelegramModel):
     """This object represents a service message about the completion of a
     giveaway without public winners."""
 
@@ -2767,7 +3128,7 @@ class GiveawayCompleted(BaseModel):
     """
 
 
-class LinkPreviewOptions(BaseModel):
+class LinkPreviewOptions(_TelegramModel):
     """Describes the options used for link preview generation."""
 
     is_disabled: Optional[bool] = None
@@ -2807,17 +3168,17 @@ class LinkPreviewOptions(BaseModel):
     """
 
 
-class UserProfilePhotos(BaseModel):
+class UserProfilePhotos(_TelegramModel):
     """This object represent a user's profile pictures."""
 
     total_count: int
     """Total number of profile pictures the target user has."""
 
-    photos: List[List["PhotoSize"]]
+    photos: Tuple[Tuple["PhotoSize", ...], ...]
     """Requested profile pictures (in up to 4 sizes each)"""
 
 
-class File(BaseModel):
+class File(_KeyedModel):
     """This object represents a file ready to be downloaded.
 
     The file can be downloaded via the link
@@ -2827,6 +3188,8 @@ class File(BaseModel):
     expires, a new one can be requested by calling getFile.
     """
 
+    _key = "file_unique_id"
+
     file_id: str
     """Identifier for this file, which can be used to download or reuse the
     file."""
@@ -2856,7 +3219,7 @@ class File(BaseModel):
     """
 
 
-class WebAppInfo(BaseModel):
+class WebAppInfo(_TelegramModel):
     """Describes a Web App."""
 
     url: str
@@ -2864,7 +3227,35 @@ class WebAppInfo(BaseModel):
     in Initializing Web Apps."""
 
 
-class ReplyKeyboardMarkup(BaseModel):
+class _ReplyMarkup(_TelegramModel):
+    """Base model for reply markups sent along with messages.
+
+    Markups are usually built once and attached to many messages, so their
+    JSON is serialized once and kept until a field of the markup is
+    reassigned. Nested buttons are not tracked, replace the whole row
+    instead of changing a button in place.
+    """
+
+    _json: Optional[str] = PrivateAttr(default=None)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name != "_json":
+            self._json = None
+
+    def to_json(self) -> str:
+        """Serialize markup for a bot API request, omitting unset fields.
+
+        Returns:
+            JSON representation of the markup.
+        """
+
+        if self._json is None:
+            self._json = dumps(self)
+        return self._json
+
+
+class ReplyKeyboardMarkup(_ReplyMarkup):
     """This object represents a custom keyboard with reply options (see
     Introduction to bots for details and examples).
 
@@ -2872,7 +3263,7 @@ class ReplyKeyboardMarkup(BaseModel):
     Telegram Business account.
     """
 
-    keyboard: List[List["KeyboardButton"]]
+    keyboard: Tuple[Tuple["KeyboardButton", ...], ...]
     """Array of button rows, each represented by an Array of KeyboardButton
     objects."""
 
@@ -2922,7 +3313,7 @@ class ReplyKeyboardMarkup(BaseModel):
     """
 
 
-class KeyboardButton(BaseModel):
+class KeyboardButton(_TelegramModel):
     """This object represents one button of the reply keyboard.
 
     At most one of the optional fields must be used to specify type of
@@ -2983,7 +3374,7 @@ class KeyboardButton(BaseModel):
     """
 
 
-class KeyboardButtonRequestUsers(BaseModel):
+class KeyboardButtonRequestUsers(_TelegramModel):
     """This object defines the criteria used to request suitable users.
 
     Information about the selected users will be shared with the bot
@@ -3038,7 +3429,7 @@ class KeyboardButtonRequestUsers(BaseModel):
     """
 
 
-class KeyboardButtonRequestChat(BaseModel):
+class KeyboardButtonRequestChat(_TelegramModel):
     """This object defines the criteria used to request a suitable chat.
 
     Information about the selected chat will be shared with the bot when
@@ -3125,7 +3516,7 @@ class KeyboardButtonRequestChat(BaseModel):
     """
 
 
-class KeyboardButtonPollType(BaseModel):
+class KeyboardButtonPollType(_TelegramModel):
     """This object represents type of a poll, which is allowed to be created
     and sent when the corresponding button is pressed."""
 
@@ -3139,7 +3530,7 @@ class KeyboardButtonPollType(BaseModel):
     """
 
 
-class ReplyKeyboardRemove(BaseModel):
+class ReplyKeyboardRemove(_ReplyMarkup):
     """Upon receiving a message with this object, Telegram clients will remove
     the current custom keyboard and display the default letter- keyboard.
 
@@ -3150,6 +3541,12 @@ class ReplyKeyboardRemove(BaseModel):
     sent on behalf of a Telegram Business account.
     """
 
+    class Config:
+        """Configuration of keyboard removal markups."""
+
+        #: bool: Instances are shared, so they are immutable.
+        frozen = True
+
     remove_keyboard: bool
     """Requests clients to remove the custom keyboard (user will not be able to
     summon this keyboard; if you want to hide the keyboard from sight but keep
@@ -3168,17 +3565,31 @@ class ReplyKeyboardRemove(BaseModel):
     haven't voted yet.
     """
 
+    @classmethod
+    @lru_cache(maxsize=4)
+    def create(cls, selective: Optional[bool] = None) -> "ReplyKeyboardRemove":
+        """Return shared markup removing the keyboard.
 
-class InlineKeyboardMarkup(BaseModel):
+        Only a few combinations of fields are possible, so one instance per
+        combination is built and reused.
+
+        Args:
+            selective: Remove the keyboard for specific users only.
+        """
+
+        return cls(remove_keyboard=True, selective=selective)
+
+
+class InlineKeyboardMarkup(_ReplyMarkup):
     """This object represents an inline keyboard that appears right next to the
     message it belongs to."""
 
-    inline_keyboard: List[List["InlineKeyboardButton"]]
+    inline_keyboard: Tuple[Tuple["InlineKeyboardButton", ...], ...]
     """Array of button rows, each represented by an Array of
     InlineKeyboardButton objects."""
 
 
-class InlineKeyboardButton(BaseModel):
+class InlineKeyboardButton(_TelegramModel):
     """This object represents one button of an inline keyboard.
 
     Exactly one of the optional fields must be used to specify type of
@@ -3271,7 +3682,7 @@ class InlineKeyboardButton(BaseModel):
     """
 
 
-class LoginUrl(BaseModel):
+class LoginUrl(_TelegramModel):
     """This object represents a parameter of the inline keyboard button used to
     automatically authorize a user.
 
@@ -3316,7 +3727,7 @@ class LoginUrl(BaseModel):
     """
 
 
-class SwitchInlineQueryChosenChat(BaseModel):
+class SwitchInlineQueryChosenChat(_TelegramModel):
     """This object represents an inline button that switches the current user
     to inline mode in a chosen chat, with an optional default inline query."""
 
@@ -3352,7 +3763,7 @@ class SwitchInlineQueryChosenChat(BaseModel):
     """
 
 
-class CallbackQuery(BaseModel):
+class CallbackQuery(_KeyedModel):
     """This object represents an incoming callback query from a callback button
     in an inline keyboard.
 
@@ -3363,6 +3774,8 @@ class CallbackQuery(BaseModel):
     data or game_short_name will be present.
     """
 
+    _key = "id"
+
     id: str
     """Unique identifier for this query."""
 
@@ -3405,7 +3818,7 @@ class CallbackQuery(BaseModel):
     """
 
 
-class ForceReply(BaseModel):
+class ForceReply(_ReplyMarkup):
     """Upon receiving a message with this object, Telegram clients will display
     a reply interface to the user (act as if the user has selected the bot's
     message and tapped 'Reply').
@@ -3437,8 +3850,27 @@ class ForceReply(BaseModel):
     """
 
 
-class ChatPhoto(BaseModel):
-    """This object represents a chat photo."""
+#: Tuple[str, ...]: Fields of :class:`ChatPhoto`, all of them file identifiers.
+_CHAT_PHOTO_FIELDS = (
+    "small_file_id",
+    "small_file_unique_id",
+    "big_file_id",
+    "big_file_unique_id",
+)
+
+
+class ChatPhoto(_TelegramModel):
+    """This object represents a chat photo.
+
+    A chat keeps its photo across many updates, so equal photos are validated
+    once and share one immutable instance.
+    """
+
+    class Config:
+        """Configuration of chat photos."""
+
+        #: bool: Instances are shared, so they are immutable.
+        frozen = True
 
     small_file_id: str
     """File identifier of small (160x160) chat photo.
@@ -3468,8 +3900,47 @@ class ChatPhoto(BaseModel):
     Can't be used to download or reuse the file.
     """
 
-
-class ChatInviteLink(BaseModel):
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def get(
+        cls,
+        small_file_id: str,
+        small_file_unique_id: str,
+        big_file_id: str,
+        big_file_unique_id: str,
+    ) -> "ChatPhoto":
+        """Return shared chat photo with the given file identifiers."""
+
+        return cls(
+            small_file_id=small_file_id,
+            small_file_unique_id=small_file_unique_id,
+            big_file_id=big_file_id,
+            big_file_unique_id=big_file_unique_id,
+        )
+
+    @classmethod
+    def _shared_instance(cls, data: Dict[str, Any]) -> Optional["ChatPhoto"]:
+        """Return the shared instance of the photo, used by validation and by
+        trusted construction alike."""
+
+        key = tuple(data.get(name) for name in _CHAT_PHOTO_FIELDS)
+        if all(isinstance(file_id, str) for file_id in key):
+            return cls.get(*key)
+        return None
+
+    @classmethod
+    def validate(cls, value: Any) -> "ChatPhoto":
+        """Validate field value, returning the shared instance for objects
+        of a known photo."""
+
+        if isinstance(value, dict):
+            shared = cls._shared_instance(value)
+            if shared is not None:
+                return shared
+        return super().validate(value)
+
+
+class ChatInviteLink(_TelegramModel):
     """Represents an invite link for a chat."""
 
     invite_link: str
@@ -3505,7 +3976,7 @@ class ChatInviteLink(BaseModel):
     expired
     """
 
-    member_limit: Optional[int] = None
+    member_limit: Optional[conint(strict=True, ge=1, le=99999)] = None
     """Optional.
 
     The maximum number of users that can be members of the chat
@@ -3519,7 +3990,43 @@ class ChatInviteLink(BaseModel):
     """
 
 
-class ChatAdministratorRights(BaseModel):
+@lru_cache(maxsize=None)
+def _rights_bits(model: Type["_RightsModel"]) -> Tuple[Tuple[str, int], ...]:
+    """Map ``can_*`` fields of ``model`` to their :class:`ChatRights` bits."""
+
+    return tuple(
+        (name, ChatRights[name[len("can_") :].upper()].value)
+        for name in model.__fields__
+        if name.startswith("can_")
+    )
+
+
+#: Tuple[Optional[bool], ...]: Values of optional flags by their 2-bit code.
+_TRI_STATES = (None, False, True)
+
+
+class _RightsModel(_TelegramModel):
+    """Base model for objects describing rights with ``can_*`` flags."""
+
+    @property
+    def rights(self) -> ChatRights:
+        """Set flags packed into a single bit mask.
+
+        Examples:
+            Rights changed between two objects::
+
+                >>> changed = old.rights ^ new.rights
+                >>> ChatRights.PIN_MESSAGES in changed
+        """
+
+        value = 0
+        for name, bit in _rights_bits(type(self)):
+            if getattr(self, name):
+                value |= bit
+        return ChatRights(value)
+
+
+class ChatAdministratorRights(_RightsModel):
     """Represents the rights of an administrator in a chat."""
 
     is_anonymous: bool
@@ -3596,7 +4103,7 @@ class ChatAdministratorRights(BaseModel):
     """
 
 
-class ChatMemberUpdated(BaseModel):
+class ChatMemberUpdated(_TelegramModel):
     """This object represents changes in the status of a chat member."""
 
     chat: "Chat"
@@ -3636,11 +4143,11 @@ class ChatMemberUpdated(BaseModel):
     """
 
 
-class ChatMemberOwner(BaseModel):
+class ChatMemberOwner(_TelegramModel):
     """Represents a chat member that owns the chat and has all administrator
     privileges."""
 
-    status: str
+    status: Literal["creator"]
     """The member's status in the chat, always “creator”"""
 
     user: "User"
@@ -3656,10 +4163,10 @@ class ChatMemberOwner(BaseModel):
     """
 
 
-class ChatMemberAdministrator(BaseModel):
+class ChatMemberAdministrator(_RightsModel):
     """Represents a chat member that has some additional privileges."""
 
-    status: str
+    status: Literal["administrator"]
     """The member's status in the chat, always “administrator”"""
 
     user: "User"
@@ -3749,24 +4256,24 @@ class ChatMemberAdministrator(BaseModel):
     """
 
 
-class ChatMemberMember(BaseModel):
+class ChatMemberMember(_TelegramModel):
     """Represents a chat member that has no additional privileges or
     restrictions."""
 
-    status: str
+    status: Literal["member"]
     """The member's status in the chat, always “member”"""
 
     user: "User"
     """Information about the user."""
 
 
-class ChatMemberRestricted(BaseModel):
+class ChatMemberRestricted(_RightsModel):
     """Represents a chat member that is under certain restrictions in the chat.
 
     Supergroups only.
     """
 
-    status: str
+    status: Literal["restricted"]
     """The member's status in the chat, always “restricted”"""
 
     user: "User"
@@ -3829,22 +4336,22 @@ class ChatMemberRestricted(BaseModel):
     """
 
 
-class ChatMemberLeft(BaseModel):
+class ChatMemberLeft(_TelegramModel):
     """Represents a chat member that isn't currently a member of the chat, but
     may join it themselves."""
 
-    status: str
+    status: Literal["left"]
     """The member's status in the chat, always “left”"""
 
     user: "User"
     """Information about the user."""
 
 
-class ChatMemberBanned(BaseModel):
+class ChatMemberBanned(_TelegramModel):
     """Represents a chat member that was banned in the chat and can't return to
     the chat or view chat messages."""
 
-    status: str
+    status: Literal["kicked"]
     """The member's status in the chat, always “kicked”"""
 
     user: "User"
@@ -3857,7 +4364,7 @@ class ChatMemberBanned(BaseModel):
     """
 
 
-class ChatJoinRequest(BaseModel):
+class ChatJoinRequest(_TelegramModel):
     """Represents a join request sent to a chat."""
 
     chat: "Chat"
@@ -3894,7 +4401,7 @@ class ChatJoinRequest(BaseModel):
     """
 
 
-class ChatPermissions(BaseModel):
+class ChatPermissions(_RightsModel):
     """Describes actions that a non-administrator user is allowed to take in a
     chat."""
 
@@ -3988,14 +4495,43 @@ class ChatPermissions(BaseModel):
     defaults to the value of can_pin_messages
     """
 
+    @property
+    def packed(self) -> int:
+        """All flags packed into a single int, two bits per flag in field
+        order: ``0`` if the flag is omitted, ``1`` if it is false and ``2``
+        if it is true.
+
+        Unlike :attr:`rights`, omitted flags are kept apart from denied
+        ones, so two permission sets are equal only if their packed values
+        are.
+        """
+
+        value = 0
+        for shift, (name, _) in enumerate(_rights_bits(type(self))):
+            flag = getattr(self, name)
+            if flag is not None:
+                value |= (2 if flag else 1) << 2 * shift
+        return value
 
-class Birthdate(BaseModel):
+    @classmethod
+    def unpack(cls, packed: int) -> "ChatPermissions":
+        """Build permissions from the value of :attr:`packed`."""
+
+        values = {}
+        for shift, (name, _) in enumerate(_rights_bits(cls)):
+            state = packed >> 2 * shift & 3
+            if state:
+                values[name] = _TRI_STATES[state]
+        return cls(**values)
+
+
+class Birthdate(_TelegramModel):
     """Describes the birthdate of a user."""
 
-    day: int
+    day: conint(strict=True, ge=1, le=31)
     """Day of the user's birth; 1-31."""
 
-    month: int
+    month: conint(strict=True, ge=1, le=12)
     """Month of the user's birth; 1-12."""
 
     year: Optional[int] = None
@@ -4005,7 +4541,7 @@ class Birthdate(BaseModel):
     """
 
 
-class BusinessIntro(BaseModel):
+class BusinessIntro(_TelegramModel):
     """Contains information about the start page settings of a Telegram
     Business account."""
 
@@ -4028,7 +4564,7 @@ class BusinessIntro(BaseModel):
     """
 
 
-class BusinessLocation(BaseModel):
+class BusinessLocation(_TelegramModel):
     """Contains information about the location of a Telegram Business
     account."""
 
@@ -4042,17 +4578,17 @@ class BusinessLocation(BaseModel):
     """
 
 
-class BusinessOpeningHoursInterval(BaseModel):
+class BusinessOpeningHoursInterval(_TelegramModel):
     """Describes an interval of time during which a business is open."""
 
-    opening_minute: int
+    opening_minute: conint(strict=True, ge=0, le=7 * 24 * 60)
     """The minute's sequence number in a week, starting on Monday, marking.
 
     the start of the time interval during which the business is open; 0
     - 7 * 24 * 60
     """
 
-    closing_minute: int
+    closing_minute: conint(strict=True, ge=0, le=8 * 24 * 60)
     """The minute's sequence number in a week, starting on Monday, marking.
 
     the end of the time interval during which the business is open; 0 - 8
@@ -4060,7 +4596,7 @@ class BusinessOpeningHoursInterval(BaseModel):
     """
 
 
-class BusinessOpeningHours(BaseModel):
+class BusinessOpeningHours(_TelegramModel):
     """Describes the opening hours of a business."""
 
     time_zone_name: str
@@ -4069,8 +4605,45 @@ class BusinessOpeningHours(BaseModel):
     opening_hours: List["BusinessOpeningHoursInterval"]
     """List of time intervals describing business opening hours."""
 
-
-class ChatLocation(BaseModel):
+    _bounds: Optional[Tuple[array, array]] = PrivateAttr(default=None)
+
+    @property
+    def bounds(self) -> Tuple[array, array]:
+        """Opening and closing minutes of all intervals, sorted by opening
+        minute, as two parallel arrays of 16-bit ints.
+
+        Built lazily on first access and kept for the model lifetime.
+        """
+
+        if self._bounds is None:
+            intervals = sorted(
+                (interval.opening_minute, interval.closing_minute)
+                for interval in self.opening_hours
+            )
+            self._bounds = (
+                array("H", [opening for opening, _ in intervals]),
+                array("H", [closing for _, closing in intervals]),
+            )
+        return self._bounds
+
+    def is_open(self, minute: int) -> bool:
+        """Check if the business is open at the minute of a week.
+
+        Args:
+            minute: The minute's sequence number in a week, starting on Monday,
+                in :attr:`time_zone_name`; 0 - 7 * 24 * 60.
+        """
+
+        opening, closing = self.bounds
+        # Intervals may close after the end of the week, on the next Monday.
+        for week_minute in (minute, minute + 7 * 24 * 60):
+            index = bisect_right(opening, week_minute) - 1
+            if index >= 0 and week_minute < closing[index]:
+                return True
+        return False
+
+
+class ChatLocation(_TelegramModel):
     """Represents a location to which a chat is connected."""
 
     location: "Location"
@@ -4083,37 +4656,37 @@ class ChatLocation(BaseModel):
     """Location address; 1-64 characters, as defined by the chat owner."""
 
 
-class ReactionTypeEmoji(BaseModel):
+class ReactionTypeEmoji(_TelegramModel):
     """The reaction is based on an emoji."""
 
-    type: str
+    _interned_fields = ("emoji",)
+
+    type: Literal["emoji"]
     """Type of the reaction, always “emoji”"""
 
     emoji: str
     """Reaction emoji.
 
-    Currently, it can be one of \"\", \"\", \"\", \"\", \"\", \"\",
-    \"\", \"\", \"\", \"\", \"\", \"\", \"\", \"\", \"\", \"\", \"\",
-    \"\", \"\", \"\", \"\", \"\", \"\", \"\", \"\", \"\", \"\", \"\",
-    \"\", \"\", \"\", \"\", \"\", \"\", \"\", \"\", \"\", \"\", \"\",
-    \"\", \"\", \"\", \"\", \"\", \"\", \"\", \"\", \"\", \"\", \"\",
-    \"\", \"\", \"\", \"\", \"\", \"\", \"\", \"\", \"\", \"\", \"\",
-    \"\", \"\", \"\", \"\", \"\", \"\", \"\", \"\", \"\", \"\", \"\",
-    \"\"
+    Currently, it can be one of "👍", "👎", "❤", "🔥", "🥰", "👏", "😁", "🤔",
+    "🤯", "😱", "🤬", "😢", "🎉", "🤩", "🤮", "💩", "🙏", "👌", "🕊", "🤡", "🥱",
+    "🥴", "😍", "🐳", "❤‍🔥", "🌚", "🌭", "💯", "🤣", "⚡", "🍌", "🏆", "💔", "🤨",
+    "😐", "🍓", "🍾", "💋", "🖕", "😈", "😴", "😭", "🤓", "👻", "👨‍💻", "👀", "🎃",
+    "🙈", "😇", "😨", "🤝", "✍", "🤗", "🫡", "🎅", "🎄", "☃", "💅", "🤪", "🗿",
+    "🆒", "💘", "🙉", "🦄", "😘", "💊", "🙊", "😎", "👾", "🤷‍♂", "🤷", "🤷‍♀", "😡"
     """
 
 
-class ReactionTypeCustomEmoji(BaseModel):
+class ReactionTypeCustomEmoji(_TelegramModel):
     """The reaction is based on a custom emoji."""
 
-    type: str
+    type: Literal["custom_emoji"]
     """Type of the reaction, always “custom_emoji”"""
 
     custom_emoji_id: str
     """Custom emoji identifier."""
 
 
-class ReactionCount(BaseModel):
+class ReactionCount(_TelegramModel):
     """Represents a reaction added to a message along with the number of times
     it was added."""
 
@@ -4124,7 +4697,7 @@ class ReactionCount(BaseModel):
     """Number of times the reaction was added."""
 
 
-class MessageReactionUpdated(BaseModel):
+class MessageReactionUpdated(_TelegramModel):
     """This object represents a change of a reaction on a message performed by
     a user."""
 
@@ -4157,7 +4730,7 @@ class MessageReactionUpdated(BaseModel):
     """
 
 
-class MessageReactionCountUpdated(BaseModel):
+class MessageReactionCountUpdated(_TelegramModel):
     """This object represents reaction changes on a message with anonymous
     reactions."""
 
@@ -4170,11 +4743,11 @@ class MessageReactionCountUpdated(BaseModel):
     date: int
     """Date of the change in Unix time."""
 
-    reactions: List["ReactionCount"]
+    reactions: Tuple["ReactionCount", ...]
     """List of reactions that are present on the message."""
 
 
-class ForumTopic(BaseModel):
+class ForumTopic(_TelegramModel):
     """This object represents a forum topic."""
 
     message_thread_id: int
@@ -4183,7 +4756,7 @@ class ForumTopic(BaseModel):
     name: str
     """Name of the topic."""
 
-    icon_color: int
+    icon_color: conint(strict=True, ge=0, le=0xFFFFFF)
     """Color of the topic icon in RGB format."""
 
     icon_custom_emoji_id: Optional[str] = None
@@ -4193,7 +4766,7 @@ class ForumTopic(BaseModel):
     """
 
 
-class BotCommand(BaseModel):
+class BotCommand(_TelegramModel):
     """This object represents a bot command."""
 
     command: str
@@ -4206,71 +4779,93 @@ class BotCommand(BaseModel):
     """Description of the command; 1-256 characters."""
 
 
-class BotCommandScopeDefault(BaseModel):
+class BotCommandScopeDefault(_SharedModel):
     """Represents the default scope of bot commands.
 
     Default commands are used if no commands with a narrower scope are
     specified for the user.
     """
 
-    type: str
+    type: Literal["default"] = "default"
     """Scope type, must be default."""
 
 
-class BotCommandScopeAllPrivateChats(BaseModel):
+class BotCommandScopeAllPrivateChats(_SharedModel):
     """Represents the scope of bot commands, covering all private chats."""
 
-    type: str
+    type: Literal["all_private_chats"] = "all_private_chats"
     """Scope type, must be all_private_chats."""
 
 
-class BotCommandScopeAllGroupChats(BaseModel):
+class BotCommandScopeAllGroupChats(_SharedModel):
     """Represents the scope of bot commands, covering all group and supergroup
     chats."""
 
-    type: str
+    type: Literal["all_group_chats"] = "all_group_chats"
     """Scope type, must be all_group_chats."""
 
 
-class BotCommandScopeAllChatAdministrators(BaseModel):
+class BotCommandScopeAllChatAdministrators(_SharedModel):
     """Represents the scope of bot commands, covering all group and supergroup
     chat administrators."""
 
-    type: str
+    type: Literal["all_chat_administrators"] = "all_chat_administrators"
     """Scope type, must be all_chat_administrators."""
 
 
-class BotCommandScopeChat(BaseModel):
+class BotCommandScopeChat(_SharedModel):
     """Represents the scope of bot commands, covering a specific chat."""
 
-    type: str
+    type: Literal["chat"] = "chat"
     """Scope type, must be chat."""
 
-    chat_id: Union[int, str]
+    chat_id: ChatId
     """Unique identifier for the target chat or username of the target
     supergroup (in the format @supergroupusername)"""
 
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def create(cls, chat_id: Union[int, str]) -> "BotCommandScopeChat":
+        """Return shared scope of the chat.
 
-class BotCommandScopeChatAdministrators(BaseModel):
+        Args:
+            chat_id: Unique identifier or username of the target chat.
+        """
+
+        return cls(chat_id=chat_id)
+
+
+class BotCommandScopeChatAdministrators(_SharedModel):
     """Represents the scope of bot commands, covering all administrators of a
     specific group or supergroup chat."""
 
-    type: str
+    type: Literal["chat_administrators"] = "chat_administrators"
     """Scope type, must be chat_administrators."""
 
-    chat_id: Union[int, str]
+    chat_id: ChatId
     """Unique identifier for the target chat or username of the target
     supergroup (in the format @supergroupusername)"""
 
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def create(cls, chat_id: Union[int, str]) -> "BotCommandScopeChatAdministrators":
+        """Return shared scope of the chat.
+
+        Args:
+            chat_id: Unique identifier or username of the target chat.
+        """
+
+        return cls(chat_id=chat_id)
 
-class BotCommandScopeChatMember(BaseModel):
+
+class BotCommandScopeChatMember(_TelegramModel):
     """Represents the scope of bot commands, covering a specific member of a
     group or supergroup chat."""
 
-    type: str
+    type: Literal["chat_member"] = "chat_member"
     """Scope type, must be chat_member."""
 
-    chat_id: Union[int, str]
+    chat_id: ChatId
     """Unique identifier for the target chat or username of the target
     supergroup (in the format @supergroupusername)"""
 
@@ -4278,38 +4873,38 @@ class BotCommandScopeChatMember(BaseModel):
     """Unique identifier of the target user."""
 
 
-class BotName(BaseModel):
+class BotName(_TelegramModel):
     """This object represents the bot's name."""
 
     name: str
     """The bot's name."""
 
 
-class BotDescription(BaseModel):
+class BotDescription(_TelegramModel):
     """This object represents the bot's description."""
 
     description: str
     """The bot's description."""
 
 
-class BotShortDescription(BaseModel):
+class BotShortDescription(_TelegramModel):
     """This object represents the bot's short description."""
 
     short_description: str
     """The bot's short description."""
 
 
-class MenuButtonCommands(BaseModel):
+class MenuButtonCommands(_SharedModel):
     """Represents a menu button, which opens the bot's list of commands."""
 
-    type: str
+    type: Literal["commands"] = "commands"
     """Type of the button, must be commands."""
 
 
-class MenuButtonWebApp(BaseModel):
+class MenuButtonWebApp(_TelegramModel):
     """Represents a menu button, which launches a Web App."""
 
-    type: str
+    type: Literal["web_app"] = "web_app"
     """Type of the button, must be web_app."""
 
     text: str
@@ -4327,25 +4922,25 @@ class MenuButtonWebApp(BaseModel):
     """
 
 
-class MenuButtonDefault(BaseModel):
+class MenuButtonDefault(_SharedModel):
     """Describes that no specific value for the menu button was set."""
 
-    type: str
+    type: Literal["default"] = "default"
     """Type of the button, must be default."""
 
 
-class ChatBoostSourcePremium(BaseModel):
+class ChatBoostSourcePremium(_TelegramModel):
     """The boost was obtained by subscribing to Telegram Premium or by gifting
     a Telegram Premium subscription to another user."""
 
-    source: str
+    source: Literal["premium"]
     """Source of the boost, always “premium”"""
 
     user: "User"
     """User that boosted the chat."""
 
 
-class ChatBoostSourceGiftCode(BaseModel):
+class ChatBoostSourceGiftCode(_TelegramModel):
     """The boost was obtained by the creation of Telegram Premium gift codes to
     boost a chat.
 
@@ -4353,21 +4948,21 @@ class ChatBoostSourceGiftCode(BaseModel):
     corresponding Telegram Premium subscription.
     """
 
-    source: str
+    source: Literal["gift_code"]
     """Source of the boost, always “gift_code”"""
 
     user: "User"
     """User for which the gift code was created."""
 
 
-class ChatBoostSourceGiveaway(BaseModel):
+class ChatBoostSourceGiveaway(_TelegramModel):
     """The boost was obtained by the creation of a Telegram Premium giveaway.
 
     This boosts the chat 4 times for the duration of the corresponding
     Telegram Premium subscription.
     """
 
-    source: str
+    source: Literal["giveaway"]
     """Source of the boost, always “giveaway”"""
 
     giveaway_message_id: int
@@ -4391,7 +4986,7 @@ class ChatBoostSourceGiveaway(BaseModel):
     """
 
 
-class ChatBoost(BaseModel):
+class ChatBoost(_TelegramModel):
     """This object contains information about a chat boost."""
 
     boost_id: str
@@ -4408,7 +5003,7 @@ class ChatBoost(BaseModel):
     """Source of the added boost."""
 
 
-class ChatBoostUpdated(BaseModel):
+class ChatBoostUpdated(_TelegramModel):
     """This object represents a boost added to a chat or changed."""
 
     chat: "Chat"
@@ -4418,7 +5013,7 @@ class ChatBoostUpdated(BaseModel):
     """Information about the chat boost."""
 
 
-class ChatBoostRemoved(BaseModel):
+class ChatBoostRemoved(_TelegramModel):
     """This object represents a boost removed from a chat."""
 
     chat: "Chat"
@@ -4434,14 +5029,14 @@ class ChatBoostRemoved(BaseModel):
     """Source of the removed boost."""
 
 
-class UserChatBoosts(BaseModel):
+class UserChatBoosts(_TelegramModel):
     """This object represents a list of boosts added to a chat by a user."""
 
     boosts: List["ChatBoost"]
     """The list of boosts added to the chat by the user."""
 
 
-class BusinessConnection(BaseModel):
+class BusinessConnection(_TelegramModel):
     """Describes the connection of the bot with a business account."""
 
     id: str
@@ -4472,7 +5067,7 @@ class BusinessConnection(BaseModel):
     """True, if the connection is active."""
 
 
-class BusinessMessagesDeleted(BaseModel):
+class BusinessMessagesDeleted(_TelegramModel):
     """This object is received when messages are deleted from a connected
     business account."""
 
@@ -4485,12 +5080,24 @@ class BusinessMessagesDeleted(BaseModel):
     The bot may not have access to the chat or the corresponding user.
     """
 
-    message_ids: List[int]
+    message_ids: Tuple[int, ...]
     """The list of identifiers of deleted messages in the chat of the business
     account."""
 
+    def tracked(self, message_ids: Union[Set[int], FrozenSet[int]]) -> FrozenSet[int]:
+        """Select deleted messages which are in ``message_ids``.
+
+        The intersection is computed by the set itself, instead of checking
+        deleted identifiers one by one.
 
-class ResponseParameters(BaseModel):
+        Args:
+            message_ids: Identifiers of messages tracked by the caller.
+        """
+
+        return frozenset(message_ids.intersection(self.message_ids))
+
+
+class ResponseParameters(_TelegramModel):
     """Describes why a request was unsuccessful."""
 
     migrate_to_chat_id: Optional[int] = None
@@ -4512,10 +5119,10 @@ class ResponseParameters(BaseModel):
     """
 
 
-class InputMediaPhoto(BaseModel):
+class InputMediaPhoto(_TelegramModel):
     """Represents a photo to be sent."""
 
-    type: str
+    type: Literal["photo"] = "photo"
     """Type of the result, must be photo."""
 
     media: str
@@ -4542,7 +5149,7 @@ class InputMediaPhoto(BaseModel):
     options for more details.
     """
 
-    caption_entities: Optional[List["MessageEntity"]] = None
+    caption_entities: Optional[Tuple["MessageEntity", ...]] = None
     """Optional.
 
     List of special entities that appear in the caption, which can be
@@ -4562,10 +5169,10 @@ class InputMediaPhoto(BaseModel):
     """
 
 
-class InputMediaVideo(BaseModel):
+class InputMediaVideo(_TelegramModel):
     """Represents a video to be sent."""
 
-    type: str
+    type: Literal["video"] = "video"
     """Type of the result, must be video."""
 
     media: str
@@ -4606,7 +5213,7 @@ class InputMediaVideo(BaseModel):
     options for more details.
     """
 
-    caption_entities: Optional[List["MessageEntity"]] = None
+    caption_entities: Optional[Tuple["MessageEntity", ...]] = None
     """Optional.
 
     List of special entities that appear in the caption, which can be
@@ -4650,11 +5257,11 @@ class InputMediaVideo(BaseModel):
     """
 
 
-class InputMediaAnimation(BaseModel):
+class InputMediaAnimation(_TelegramModel):
     """Represents an animation file (GIF or H.264/MPEG-4 AVC video without
     sound) to be sent."""
 
-    type: str
+    type: Literal["animation"] = "animation"
     """Type of the result, must be animation."""
 
     media: str
@@ -4695,7 +5302,7 @@ class InputMediaAnimation(BaseModel):
     options for more details.
     """
 
-    caption_entities: Optional[List["MessageEntity"]] = None
+    caption_entities: Optional[Tuple["MessageEntity", ...]] = None
     """Optional.
 
     List of special entities that appear in the caption, which can be
@@ -4734,10 +5341,10 @@ class InputMediaAnimation(BaseModel):
     """
 
 
-class InputMediaAudio(BaseModel):
+class InputMediaAudio(_TelegramModel):
     """Represents an audio file to be treated as music to be sent."""
 
-    type: str
+    type: Literal["audio"] = "audio"
     """Type of the result, must be audio."""
 
     media: str
@@ -4778,7 +5385,7 @@ class InputMediaAudio(BaseModel):
     options for more details.
     """
 
-    caption_entities: Optional[List["MessageEntity"]] = None
+    caption_entities: Optional[Tuple["MessageEntity", ...]] = None
     """Optional.
 
     List of special entities that appear in the caption, which can be
@@ -4804,10 +5411,10 @@ class InputMediaAudio(BaseModel):
     """
 
 
-class InputMediaDocument(BaseModel):
+class InputMediaDocument(_TelegramModel):
     """Represents a general file to be sent."""
 
-    type: str
+    type: Literal["document"] = "document"
     """Type of the result, must be document."""
 
     media: str
@@ -4848,7 +5455,7 @@ class InputMediaDocument(BaseModel):
     options for more details.
     """
 
-    caption_entities: Optional[List["MessageEntity"]] = None
+    caption_entities: Optional[Tuple["MessageEntity", ...]] = None
     """Optional.
 
     List of special entities that appear in the caption, which can be
@@ -4864,10 +5471,10 @@ class InputMediaDocument(BaseModel):
     """
 
 
-class InputPaidMediaPhoto(BaseModel):
+class InputPaidMediaPhoto(_TelegramModel):
     """The paid media to send is a photo."""
 
-    type: str
+    type: Literal["photo"] = "photo"
     """Type of the media, must be photo."""
 
     media: str
@@ -4881,10 +5488,10 @@ class InputPaidMediaPhoto(BaseModel):
     """
 
 
-class InputPaidMediaVideo(BaseModel):
+class InputPaidMediaVideo(_TelegramModel):
     """The paid media to send is a video."""
 
-    type: str
+    type: Literal["video"] = "video"
     """Type of the media, must be video."""
 
     media: str
@@ -4936,7 +5543,7 @@ class InputPaidMediaVideo(BaseModel):
     """
 
 
-class Sticker(BaseModel):
+class Sticker(_TelegramModel):
     """This object represents a sticker."""
 
     file_id: str
@@ -5020,7 +5627,7 @@ class Sticker(BaseModel):
     """
 
 
-class StickerSet(BaseModel):
+class StickerSet(_TelegramModel):
     """This object represents a sticker set."""
 
     name: str
@@ -5043,10 +5650,17 @@ class StickerSet(BaseModel):
     """
 
 
-class MaskPosition(BaseModel):
+class MaskPosition(_TelegramModel):
     """This object describes the position on faces where a mask should be
     placed by default."""
 
+    class Config:
+        """Configuration of mask positions."""
+
+        #: bool: Instances are immutable and hashable, like input stickers
+        #  holding them.
+        frozen = True
+
     point: str
     """The part of the face relative to which the mask should be placed.
 
@@ -5076,9 +5690,15 @@ class MaskPosition(BaseModel):
     """
 
 
-class InputSticker(BaseModel):
+class InputSticker(_TelegramModel):
     """This object describes a sticker to be added to a sticker set."""
 
+    class Config:
+        """Configuration of input stickers."""
+
+        #: bool: Instances are immutable, so they can be deduplicated in sets.
+        frozen = True
+
     sticker: Union["InputFile", str]
     """The added sticker.
 
@@ -5095,7 +5715,7 @@ class InputSticker(BaseModel):
     """Format of the added sticker, must be one of “static” for a .WEBP or .PNG
     image, “animated” for a .TGS animation, “video” for a WEBM video."""
 
-    emoji_list: List[str]
+    emoji_list: Tuple[str, ...]
     """List of 1-20 emoji associated with the sticker."""
 
     mask_position: Optional["MaskPosition"] = None
@@ -5105,15 +5725,22 @@ class InputSticker(BaseModel):
     stickers only.
     """
 
-    keywords: Optional[List[str]] = None
+    keywords: Optional[Tuple[str, ...]] = None
     """Optional.
 
     List of 0-20 search keywords for the sticker with total length of up
     to 64 characters. For “regular” and “custom_emoji” stickers only.
     """
 
+    _intern_strings = validator(
+        "emoji_list",
+        "keywords",
+        each_item=True,
+        allow_reuse=True,
+    )(_intern_string)
 
-class InlineQuery(BaseModel):
+
+class InlineQuery(_TelegramModel):
     """This object represents an incoming inline query.
 
     When the user sends an empty query, your bot could return some
@@ -5149,7 +5776,7 @@ class InlineQuery(BaseModel):
     """
 
 
-class InlineQueryResultsButton(BaseModel):
+class InlineQueryResultsButton(_TelegramModel):
     """This object represents a button to be shown above inline query results.
 
     You must use exactly one of the optional fields.
@@ -5182,10 +5809,10 @@ class InlineQueryResultsButton(BaseModel):
     """
 
 
-class InlineQueryResultArticle(BaseModel):
+class InlineQueryResultArticle(_TelegramModel):
     """Represents a link to an article or web page."""
 
-    type: str
+    type: Literal["article"] = "article"
     """Type of the result, must be article."""
 
     id: str
@@ -5240,7 +5867,7 @@ class InlineQueryResultArticle(BaseModel):
     """
 
 
-class InlineQueryResultPhoto(BaseModel):
+class InlineQueryResultPhoto(_TelegramModel):
     """Represents a link to a photo.
 
     By default, this photo will be sent by the user with optional
@@ -5248,7 +5875,7 @@ class InlineQueryResultPhoto(BaseModel):
     message with the specified content instead of the photo.
     """
 
-    type: str
+    type: Literal["photo"] = "photo"
     """Type of the result, must be photo."""
 
     id: str
@@ -5301,7 +5928,7 @@ class InlineQueryResultPhoto(BaseModel):
     options for more details.
     """
 
-    caption_entities: Optional[List["MessageEntity"]] = None
+    caption_entities: Optional[Tuple["MessageEntity", ...]] = None
     """Optional.
 
     List of special entities that appear in the caption, which can be
@@ -5327,7 +5954,7 @@ class InlineQueryResultPhoto(BaseModel):
     """
 
 
-class InlineQueryResultGif(BaseModel):
+class InlineQueryResultGif(_TelegramModel):
     """Represents a link to an animated GIF file.
 
     By default, this animated GIF file will be sent by the user with
@@ -5336,7 +5963,7 @@ class InlineQueryResultGif(BaseModel):
     animation.
     """
 
-    type: str
+    type: Literal["gif"] = "gif"
     """Type of the result, must be gif."""
 
     id: str
@@ -5397,7 +6024,7 @@ class InlineQueryResultGif(BaseModel):
     more details.
     """
 
-    caption_entities: Optional[List["MessageEntity"]] = None
+    caption_entities: Optional[Tuple["MessageEntity", ...]] = None
     """Optional.
 
     List of special entities that appear in the caption, which can be
@@ -5423,7 +6050,7 @@ class InlineQueryResultGif(BaseModel):
     """
 
 
-class InlineQueryResultMpeg4Gif(BaseModel):
+class InlineQueryResultMpeg4Gif(_TelegramModel):
     """Represents a link to a video animation (H.264/MPEG-4 AVC video without
     sound).
 
@@ -5433,7 +6060,7 @@ class InlineQueryResultMpeg4Gif(BaseModel):
     animation.
     """
 
-    type: str
+    type: Literal["mpeg4_gif"] = "mpeg4_gif"
     """Type of the result, must be mpeg4_gif."""
 
     id: str
@@ -5494,7 +6121,7 @@ class InlineQueryResultMpeg4Gif(BaseModel):
     more details.
     """
 
-    caption_entities: Optional[List["MessageEntity"]] = None
+    caption_entities: Optional[Tuple["MessageEntity", ...]] = None
     """Optional.
 
     List of special entities that appear in the caption, which can be
@@ -5520,7 +6147,7 @@ class InlineQueryResultMpeg4Gif(BaseModel):
     """
 
 
-class InlineQueryResultVideo(BaseModel):
+class InlineQueryResultVideo(_TelegramModel):
     """Represents a link to a page containing an embedded video player or a
     video file.
 
@@ -5529,7 +6156,7 @@ class InlineQueryResultVideo(BaseModel):
     to send a message with the specified content instead of the video.
     """
 
-    type: str
+    type: Literal["video"] = "video"
     """Type of the result, must be video."""
 
     id: str
@@ -5561,7 +6188,7 @@ class InlineQueryResultVideo(BaseModel):
     options for more details.
     """
 
-    caption_entities: Optional[List["MessageEntity"]] = None
+    caption_entities: Optional[Tuple["MessageEntity", ...]] = None
     """Optional.
 
     List of special entities that appear in the caption, which can be
@@ -5613,7 +6240,7 @@ class InlineQueryResultVideo(BaseModel):
     """
 
 
-class InlineQueryResultAudio(BaseModel):
+class InlineQueryResultAudio(_TelegramModel):
     """Represents a link to an MP3 audio file.
 
     By default, this audio file will be sent by the user. Alternatively,
@@ -5621,7 +6248,7 @@ class InlineQueryResultAudio(BaseModel):
     specified content instead of the audio.
     """
 
-    type: str
+    type: Literal["audio"] = "audio"
     """Type of the result, must be audio."""
 
     id: str
@@ -5646,7 +6273,7 @@ class InlineQueryResultAudio(BaseModel):
     options for more details.
     """
 
-    caption_entities: Optional[List["MessageEntity"]] = None
+    caption_entities: Optional[Tuple["MessageEntity", ...]] = None
     """Optional.
 
     List of special entities that appear in the caption, which can be
@@ -5678,7 +6305,7 @@ class InlineQueryResultAudio(BaseModel):
     """
 
 
-class InlineQueryResultVoice(BaseModel):
+class InlineQueryResultVoice(_TelegramModel):
     """Represents a link to a voice recording in an .OGG container encoded with
     OPUS.
 
@@ -5687,7 +6314,7 @@ class InlineQueryResultVoice(BaseModel):
     with the specified content instead of the the voice message.
     """
 
-    type: str
+    type: Literal["voice"] = "voice"
     """Type of the result, must be voice."""
 
     id: str
@@ -5712,7 +6339,7 @@ class InlineQueryResultVoice(BaseModel):
     formatting options for more details.
     """
 
-    caption_entities: Optional[List["MessageEntity"]] = None
+    caption_entities: Optional[Tuple["MessageEntity", ...]] = None
     """Optional.
 
     List of special entities that appear in the caption, which can be
@@ -5738,7 +6365,7 @@ class InlineQueryResultVoice(BaseModel):
     """
 
 
-class InlineQueryResultDocument(BaseModel):
+class InlineQueryResultDocument(_TelegramModel):
     """Represents a link to a file.
 
     By default, this file will be sent by the user with an optional
@@ -5747,7 +6374,7 @@ class InlineQueryResultDocument(BaseModel):
     only .PDF and .ZIP files can be sent using this method.
     """
 
-    type: str
+    type: Literal["document"] = "document"
     """Type of the result, must be document."""
 
     id: str
@@ -5777,7 +6404,7 @@ class InlineQueryResultDocument(BaseModel):
     options for more details.
     """
 
-    caption_entities: Optional[List["MessageEntity"]] = None
+    caption_entities: Optional[Tuple["MessageEntity", ...]] = None
     """Optional.
 
     List of special entities that appear in the caption, which can be
@@ -5821,7 +6448,7 @@ class InlineQueryResultDocument(BaseModel):
     """
 
 
-class InlineQueryResultLocation(BaseModel):
+class InlineQueryResultLocation(_TelegramModel):
     """Represents a location on a map.
 
     By default, the location will be sent by the user. Alternatively,
@@ -5829,7 +6456,7 @@ class InlineQueryResultLocation(BaseModel):
     specified content instead of the location.
     """
 
-    type: str
+    type: Literal["location"] = "location"
     """Type of the result, must be location."""
 
     id: str
@@ -5905,7 +6532,7 @@ class InlineQueryResultLocation(BaseModel):
     """
 
 
-class InlineQueryResultVenue(BaseModel):
+class InlineQueryResultVenue(_TelegramModel):
     """Represents a venue.
 
     By default, the venue will be sent by the user. Alternatively, you
@@ -5913,7 +6540,7 @@ class InlineQueryResultVenue(BaseModel):
     content instead of the venue.
     """
 
-    type: str
+    type: Literal["venue"] = "venue"
     """Type of the result, must be venue."""
 
     id: str
@@ -5988,7 +6615,7 @@ class InlineQueryResultVenue(BaseModel):
     """
 
 
-class InlineQueryResultContact(BaseModel):
+class InlineQueryResultContact(_TelegramModel):
     """Represents a contact with a phone number.
 
     By default, this contact will be sent by the user. Alternatively,
@@ -5996,7 +6623,7 @@ class InlineQueryResultContact(BaseModel):
     specified content instead of the contact.
     """
 
-    type: str
+    type: Literal["contact"] = "contact"
     """Type of the result, must be contact."""
 
     id: str
@@ -6052,10 +6679,10 @@ class InlineQueryResultContact(BaseModel):
     """
 
 
-class InlineQueryResultGame(BaseModel):
+class InlineQueryResultGame(_TelegramModel):
     """Represents a Game."""
 
-    type: str
+    type: Literal["game"] = "game"
     """Type of the result, must be game."""
 
     id: str
@@ -6071,7 +6698,7 @@ class InlineQueryResultGame(BaseModel):
     """
 
 
-class InlineQueryResultCachedPhoto(BaseModel):
+class InlineQueryResultCachedPhoto(_TelegramModel):
     """Represents a link to a photo stored on the Telegram servers.
 
     By default, this photo will be sent by the user with an optional
@@ -6079,7 +6706,7 @@ class InlineQueryResultCachedPhoto(BaseModel):
     message with the specified content instead of the photo.
     """
 
-    type: str
+    type: Literal["photo"] = "photo"
     """Type of the result, must be photo."""
 
     id: str
@@ -6114,7 +6741,7 @@ class InlineQueryResultCachedPhoto(BaseModel):
     options for more details.
     """
 
-    caption_entities: Optional[List["MessageEntity"]] = None
+    caption_entities: Optional[Tuple["MessageEntity", ...]] = None
     """Optional.
 
     List of special entities that appear in the caption, which can be
@@ -6140,7 +6767,7 @@ class InlineQueryResultCachedPhoto(BaseModel):
     """
 
 
-class InlineQueryResultCachedGif(BaseModel):
+class InlineQueryResultCachedGif(_TelegramModel):
     """Represents a link to an animated GIF file stored on the Telegram
     servers.
 
@@ -6149,7 +6776,7 @@ class InlineQueryResultCachedGif(BaseModel):
     to send a message with specified content instead of the animation.
     """
 
-    type: str
+    type: Literal["gif"] = "gif"
     """Type of the result, must be gif."""
 
     id: str
@@ -6178,7 +6805,7 @@ class InlineQueryResultCachedGif(BaseModel):
     more details.
     """
 
-    caption_entities: Optional[List["MessageEntity"]] = None
+    caption_entities: Optional[Tuple["MessageEntity", ...]] = None
     """Optional.
 
     List of special entities that appear in the caption, which can be
@@ -6204,7 +6831,7 @@ class InlineQueryResultCachedGif(BaseModel):
     """
 
 
-class InlineQueryResultCachedMpeg4Gif(BaseModel):
+class InlineQueryResultCachedMpeg4Gif(_TelegramModel):
     """Represents a link to a video animation (H.264/MPEG-4 AVC video without
     sound) stored on the Telegram servers.
 
@@ -6214,7 +6841,7 @@ class InlineQueryResultCachedMpeg4Gif(BaseModel):
     instead of the animation.
     """
 
-    type: str
+    type: Literal["mpeg4_gif"] = "mpeg4_gif"
     """Type of the result, must be mpeg4_gif."""
 
     id: str
@@ -6243,7 +6870,7 @@ class InlineQueryResultCachedMpeg4Gif(BaseModel):
     more details.
     """
 
-    caption_entities: Optional[List["MessageEntity"]] = None
+    caption_entities: Optional[Tuple["MessageEntity", ...]] = None
     """Optional.
 
     List of special entities that appear in the caption, which can be
@@ -6269,7 +6896,7 @@ class InlineQueryResultCachedMpeg4Gif(BaseModel):
     """
 
 
-class InlineQueryResultCachedSticker(BaseModel):
+class InlineQueryResultCachedSticker(_TelegramModel):
     """Represents a link to a sticker stored on the Telegram servers.
 
     By default, this sticker will be sent by the user. Alternatively,
@@ -6277,7 +6904,7 @@ class InlineQueryResultCachedSticker(BaseModel):
     specified content instead of the sticker.
     """
 
-    type: str
+    type: Literal["sticker"] = "sticker"
     """Type of the result, must be sticker."""
 
     id: str
@@ -6299,7 +6926,7 @@ class InlineQueryResultCachedSticker(BaseModel):
     """
 
 
-class InlineQueryResultCachedDocument(BaseModel):
+class InlineQueryResultCachedDocument(_TelegramModel):
     """Represents a link to a file stored on the Telegram servers.
 
     By default, this file will be sent by the user with an optional
@@ -6307,7 +6934,7 @@ class InlineQueryResultCachedDocument(BaseModel):
     message with the specified content instead of the file.
     """
 
-    type: str
+    type: Literal["document"] = "document"
     """Type of the result, must be document."""
 
     id: str
@@ -6339,7 +6966,7 @@ class InlineQueryResultCachedDocument(BaseModel):
     options for more details.
     """
 
-    caption_entities: Optional[List["MessageEntity"]] = None
+    caption_entities: Optional[Tuple["MessageEntity", ...]] = None
     """Optional.
 
     List of special entities that appear in the caption, which can be
@@ -6359,7 +6986,7 @@ class InlineQueryResultCachedDocument(BaseModel):
     """
 
 
-class InlineQueryResultCachedVideo(BaseModel):
+class InlineQueryResultCachedVideo(_TelegramModel):
     """Represents a link to a video file stored on the Telegram servers.
 
     By default, this video file will be sent by the user with an
@@ -6367,7 +6994,7 @@ class InlineQueryResultCachedVideo(BaseModel):
     to send a message with the specified content instead of the video.
     """
 
-    type: str
+    type: Literal["video"] = "video"
     """Type of the result, must be video."""
 
     id: str
@@ -6399,7 +7026,7 @@ class InlineQueryResultCachedVideo(BaseModel):
     options for more details.
     """
 
-    caption_entities: Optional[List["MessageEntity"]] = None
+    caption_entities: Optional[Tuple["MessageEntity", ...]] = None
     """Optional.
 
     List of special entities that appear in the caption, which can be
@@ -6425,7 +7052,7 @@ class InlineQueryResultCachedVideo(BaseModel):
     """
 
 
-class InlineQueryResultCachedVoice(BaseModel):
+class InlineQueryResultCachedVoice(_TelegramModel):
     """Represents a link to a voice message stored on the Telegram servers.
 
     By default, this voice message will be sent by the user.
@@ -6433,7 +7060,7 @@ class InlineQueryResultCachedVoice(BaseModel):
     with the specified content instead of the voice message.
     """
 
-    type: str
+    type: Literal["voice"] = "voice"
     """Type of the result, must be voice."""
 
     id: str
@@ -6458,7 +7085,7 @@ class InlineQueryResultCachedVoice(BaseModel):
     formatting options for more details.
     """
 
-    caption_entities: Optional[List["MessageEntity"]] = None
+    caption_entities: Optional[Tuple["MessageEntity", ...]] = None
     """Optional.
 
     List of special entities that appear in the caption, which can be
@@ -6478,7 +7105,7 @@ class InlineQueryResultCachedVoice(BaseModel):
     """
 
 
-class InlineQueryResultCachedAudio(BaseModel):
+class InlineQueryResultCachedAudio(_TelegramModel):
     """Represents a link to an MP3 audio file stored on the Telegram servers.
 
     By default, this audio file will be sent by the user. Alternatively,
@@ -6486,7 +7113,7 @@ class InlineQueryResultCachedAudio(BaseModel):
     specified content instead of the audio.
     """
 
-    type: str
+    type: Literal["audio"] = "audio"
     """Type of the result, must be audio."""
 
     id: str
@@ -6508,7 +7135,7 @@ class InlineQueryResultCachedAudio(BaseModel):
     options for more details.
     """
 
-    caption_entities: Optional[List["MessageEntity"]] = None
+    caption_entities: Optional[Tuple["MessageEntity", ...]] = None
     """Optional.
 
     List of special entities that appear in the caption, which can be
@@ -6528,7 +7155,7 @@ class InlineQueryResultCachedAudio(BaseModel):
     """
 
 
-class InputTextMessageContent(BaseModel):
+class InputTextMessageContent(_TelegramModel):
     """Represents the content of a text message to be sent as the result of an
     inline query."""
 
@@ -6542,7 +7169,7 @@ class InputTextMessageContent(BaseModel):
     options for more details.
     """
 
-    entities: Optional[List["MessageEntity"]] = None
+    entities: Optional[Tuple["MessageEntity", ...]] = None
     """Optional.
 
     List of special entities that appear in message text, which can be
@@ -6556,7 +7183,7 @@ class InputTextMessageContent(BaseModel):
     """
 
 
-class InputLocationMessageContent(BaseModel):
+class InputLocationMessageContent(_TelegramModel):
     """Represents the content of a location message to be sent as the result of
     an inline query."""
 
@@ -6597,7 +7224,7 @@ class InputLocationMessageContent(BaseModel):
     """
 
 
-class InputVenueMessageContent(BaseModel):
+class InputVenueMessageContent(_TelegramModel):
     """Represents the content of a venue message to be sent as the result of an
     inline query."""
 
@@ -6640,7 +7267,7 @@ class InputVenueMessageContent(BaseModel):
     """
 
 
-class InputContactMessageContent(BaseModel):
+class InputContactMessageContent(_TelegramModel):
     """Represents the content of a contact message to be sent as the result of
     an inline query."""
 
@@ -6664,10 +7291,12 @@ class InputContactMessageContent(BaseModel):
     """
 
 
-class InputInvoiceMessageContent(BaseModel):
+class InputInvoiceMessageContent(_TelegramModel):
     """Represents the content of an invoice message to be sent as the result of
     an inline query."""
 
+    _interned_fields = ("currency",)
+
     title: str
     """Product name, 1-32 characters."""
 
@@ -6687,7 +7316,7 @@ class InputInvoiceMessageContent(BaseModel):
     Pass “XTR” for payments in Telegram Stars.
     """
 
-    prices: List["LabeledPrice"]
+    prices: Tuple["LabeledPrice", ...]
     """Price breakdown, a JSON-serialized list of components (e.g. product
     price, tax, discount, delivery cost, delivery tax, bonus, etc.).
 
@@ -6805,7 +7434,7 @@ class InputInvoiceMessageContent(BaseModel):
     """
 
 
-class ChosenInlineResult(BaseModel):
+class ChosenInlineResult(_TelegramModel):
     """Represents a result of an inline query that was chosen by the user and
     sent to their chat partner."""
 
@@ -6833,7 +7462,7 @@ class ChosenInlineResult(BaseModel):
     """
 
 
-class SentWebAppMessage(BaseModel):
+class SentWebAppMessage(_TelegramModel):
     """Describes an inline message sent by a Web App on behalf of a user."""
 
     inline_message_id: Optional[str] = None
@@ -6844,7 +7473,7 @@ class SentWebAppMessage(BaseModel):
     """
 
 
-class LabeledPrice(BaseModel):
+class LabeledPrice(_TelegramModel):
     """This object represents a portion of the price for goods or services."""
 
     label: str
@@ -6860,9 +7489,11 @@ class LabeledPrice(BaseModel):
     """
 
 
-class Invoice(BaseModel):
+class Invoice(_TelegramModel):
     """This object contains basic information about an invoice."""
 
+    _interned_fields = ("currency",)
+
     title: str
     """Product name."""
 
@@ -6887,9 +7518,11 @@ class Invoice(BaseModel):
     """
 
 
-class ShippingAddress(BaseModel):
+class ShippingAddress(_TelegramModel):
     """This object represents a shipping address."""
 
+    _interned_fields = ("country_code", "state")
+
     country_code: str
     """Two-letter ISO 3166-1 alpha-2 country code."""
 
@@ -6909,7 +7542,7 @@ class ShippingAddress(BaseModel):
     """Address post code."""
 
 
-class OrderInfo(BaseModel):
+class OrderInfo(_TelegramModel):
     """This object represents information about an order."""
 
     name: Optional[str] = None
@@ -6937,7 +7570,7 @@ class OrderInfo(BaseModel):
     """
 
 
-class ShippingOption(BaseModel):
+class ShippingOption(_TelegramModel):
     """This object represents one shipping option."""
 
     id: str
@@ -6946,13 +7579,15 @@ class ShippingOption(BaseModel):
     title: str
     """Option title."""
 
-    prices: List["LabeledPrice"]
+    prices: Tuple["LabeledPrice", ...]
     """List of price portions."""
 
 
-class SuccessfulPayment(BaseModel):
+class SuccessfulPayment(_TelegramModel):
     """This object contains basic information about a successful payment."""
 
+    _interned_fields = ("currency",)
+
     currency: str
     """Three-letter ISO 4217 currency code, or “XTR” for payments in Telegram
     Stars."""
@@ -6988,7 +7623,7 @@ class SuccessfulPayment(BaseModel):
     """
 
 
-class ShippingQuery(BaseModel):
+class ShippingQuery(_TelegramModel):
     """This object contains information about an incoming shipping query."""
 
     id: str
@@ -7004,10 +7639,12 @@ class ShippingQuery(BaseModel):
     """User specified shipping address."""
 
 
-class PreCheckoutQuery(BaseModel):
+class PreCheckoutQuery(_TelegramModel):
     """This object contains information about an incoming pre-checkout
     query."""
 
+    _interned_fields = ("currency",)
+
     id: str
     """Unique query identifier."""
 
@@ -7043,17 +7680,17 @@ class PreCheckoutQuery(BaseModel):
     """
 
 
-class RevenueWithdrawalStatePending(BaseModel):
+class RevenueWithdrawalStatePending(_MarkerModel):
     """The withdrawal is in progress."""
 
-    type: str
+    type: Literal["pending"] = "pending"
     """Type of the state, always “pending”"""
 
 
-class RevenueWithdrawalStateSucceeded(BaseModel):
+class RevenueWithdrawalStateSucceeded(_TelegramModel):
     """The withdrawal succeeded."""
 
-    type: str
+    type: Literal["succeeded"]
     """Type of the state, always “succeeded”"""
 
     date: int
@@ -7063,17 +7700,17 @@ class RevenueWithdrawalStateSucceeded(BaseModel):
     """An HTTPS URL that can be used to see transaction details."""
 
 
-class RevenueWithdrawalStateFailed(BaseModel):
+class RevenueWithdrawalStateFailed(_MarkerModel):
     """The withdrawal failed and the transaction was refunded."""
 
-    type: str
+    type: Literal["failed"] = "failed"
     """Type of the state, always “failed”"""
 
 
-class TransactionPartnerUser(BaseModel):
+class TransactionPartnerUser(_TelegramModel):
     """Describes a transaction with a user."""
 
-    type: str
+    type: Literal["user"]
     """Type of the transaction partner, always “user”"""
 
     user: "User"
@@ -7086,10 +7723,10 @@ class TransactionPartnerUser(BaseModel):
     """
 
 
-class TransactionPartnerFragment(BaseModel):
+class TransactionPartnerFragment(_TelegramModel):
     """Describes a withdrawal transaction with Fragment."""
 
-    type: str
+    type: Literal["fragment"]
     """Type of the transaction partner, always “fragment”"""
 
     withdrawal_state: Optional["RevenueWithdrawalState"] = None
@@ -7099,21 +7736,21 @@ class TransactionPartnerFragment(BaseModel):
     """
 
 
-class TransactionPartnerTelegramAds(BaseModel):
+class TransactionPartnerTelegramAds(_MarkerModel):
     """Describes a withdrawal transaction to the Telegram Ads platform."""
 
-    type: str
+    type: Literal["telegram_ads"] = "telegram_ads"
     """Type of the transaction partner, always “telegram_ads”"""
 
 
-class TransactionPartnerOther(BaseModel):
+class TransactionPartnerOther(_MarkerModel):
     """Describes a transaction with an unknown source or recipient."""
 
-    type: str
+    type: Literal["other"] = "other"
     """Type of the transaction partner, always “other”"""
 
 
-class StarTransaction(BaseModel):
+class StarTransaction(_TelegramModel):
     """Describes a Telegram Star transaction."""
 
     id: str
@@ -7147,14 +7784,14 @@ class StarTransaction(BaseModel):
     """
 
 
-class StarTransactions(BaseModel):
+class StarTransactions(_TelegramModel):
     """Contains a list of Telegram Star transactions."""
 
     transactions: List["StarTransaction"]
     """The list of transactions."""
 
 
-class PassportData(BaseModel):
+class PassportData(_TelegramModel):
     """Describes Telegram Passport data shared with the bot by the user."""
 
     data: List["EncryptedPassportElement"]
@@ -7165,7 +7802,7 @@ class PassportData(BaseModel):
     """Encrypted credentials required to decrypt the data."""
 
 
-class PassportFile(BaseModel):
+class PassportFile(_TelegramModel):
     """This object represents a file uploaded to Telegram Passport.
 
     Currently all Telegram Passport files are in JPEG format when
@@ -7190,7 +7827,49 @@ class PassportFile(BaseModel):
     """Unix time when the file was uploaded."""
 
 
-class EncryptedPassportElement(BaseModel):
+#: FrozenSet[str]: Telegram Passport documents with a front side.
+_PASSPORT_FRONT_SIDE_TYPES = frozenset(
+    ("passport", "driver_license", "identity_card", "internal_passport"),
+)
+#: FrozenSet[str]: Telegram Passport documents with a reverse side.
+_PASSPORT_REVERSE_SIDE_TYPES = frozenset(("driver_license", "identity_card"))
+#: FrozenSet[str]: Telegram Passport elements filled in as data fields.
+_PASSPORT_DATA_TYPES = _PASSPORT_FRONT_SIDE_TYPES | {"personal_details", "address"}
+#: FrozenSet[str]: Telegram Passport elements uploaded as scans of documents.
+_PASSPORT_FILE_TYPES = frozenset(
+    (
+        "utility_bill",
+        "bank_statement",
+        "rental_agreement",
+        "passport_registration",
+        "temporary_registration",
+    ),
+)
+#: FrozenSet[str]: Telegram Passport elements that may have a translation.
+_PASSPORT_TRANSLATION_TYPES = _PASSPORT_FRONT_SIDE_TYPES | _PASSPORT_FILE_TYPES
+#: FrozenSet[str]: All Telegram Passport element types.
+PASSPORT_ELEMENT_TYPES = (
+    _PASSPORT_DATA_TYPES | _PASSPORT_FILE_TYPES | {"phone_number", "email"}
+)
+
+
+def _one_of(allowed: FrozenSet[str]) -> Callable[[Any, Any], Any]:
+    """Build a validator interning the value and checking it is in ``allowed``.
+
+    The set is built once with the model, so checking a value neither
+    allocates nor scans a list.
+    """
+
+    def check(cls, value: Any) -> Any:
+        value = _intern_string(cls, value)
+        if isinstance(value, str) and value not in allowed:
+            raise ValueError(f"{value!r} is not an allowed element type")
+        return value
+
+    return check
+
+
+class EncryptedPassportElement(_TelegramModel):
     """Describes documents or other Telegram Passport elements shared with the
     bot by the user."""
 
@@ -7279,8 +7958,12 @@ class EncryptedPassportElement(BaseModel):
     EncryptedCredentials.
     """
 
+    _check_type = validator("type", pre=True, allow_reuse=True)(
+        _one_of(PASSPORT_ELEMENT_TYPES),
+    )
+
 
-class EncryptedCredentials(BaseModel):
+class EncryptedCredentials(_TelegramModel):
     """Describes data required for decrypting and authenticating
     EncryptedPassportElement.
 
@@ -7301,14 +7984,14 @@ class EncryptedCredentials(BaseModel):
     for data decryption."""
 
 
-class PassportElementErrorDataField(BaseModel):
+class PassportElementErrorDataField(_TelegramModel):
     """Represents an issue in one of the data fields that was provided by the
     user.
 
     The error is considered resolved when the field's value changes.
     """
 
-    source: str
+    source: Literal["data"] = "data"
     """Error source, must be data."""
 
     type: str
@@ -7325,15 +8008,19 @@ class PassportElementErrorDataField(BaseModel):
     message: str
     """Error message."""
 
+    _check_type = validator("type", pre=True, allow_reuse=True)(
+        _one_of(_PASSPORT_DATA_TYPES),
+    )
+
 
-class PassportElementErrorFrontSide(BaseModel):
+class PassportElementErrorFrontSide(_TelegramModel):
     """Represents an issue with the front side of a document.
 
     The error is considered resolved when the file with the front side
     of the document changes.
     """
 
-    source: str
+    source: Literal["front_side"] = "front_side"
     """Error source, must be front_side."""
 
     type: str
@@ -7346,15 +8033,19 @@ class PassportElementErrorFrontSide(BaseModel):
     message: str
     """Error message."""
 
+    _check_type = validator("type", pre=True, allow_reuse=True)(
+        _one_of(_PASSPORT_FRONT_SIDE_TYPES),
+    )
 
-class PassportElementErrorReverseSide(BaseModel):
+
+class PassportElementErrorReverseSide(_TelegramModel):
     """Represents an issue with the reverse side of a document.
 
     The error is considered resolved when the file with reverse side of
     the document changes.
     """
 
-    source: str
+    source: Literal["reverse_side"] = "reverse_side"
     """Error source, must be reverse_side."""
 
     type: str
@@ -7368,15 +8059,19 @@ class PassportElementErrorReverseSide(BaseModel):
     message: str
     """Error message."""
 
+    _check_type = validator("type", pre=True, allow_reuse=True)(
+        _one_of(_PASSPORT_REVERSE_SIDE_TYPES),
+    )
+
 
-class PassportElementErrorSelfie(BaseModel):
+class PassportElementErrorSelfie(_TelegramModel):
     """Represents an issue with the selfie with a document.
 
     The error is considered resolved when the file with the selfie
     changes.
     """
 
-    source: str
+    source: Literal["selfie"] = "selfie"
     """Error source, must be selfie."""
 
     type: str
@@ -7389,15 +8084,19 @@ class PassportElementErrorSelfie(BaseModel):
     message: str
     """Error message."""
 
+    _check_type = validator("type", pre=True, allow_reuse=True)(
+        _one_of(_PASSPORT_FRONT_SIDE_TYPES),
+    )
+
 
-class PassportElementErrorFile(BaseModel):
+class PassportElementErrorFile(_TelegramModel):
     """Represents an issue with a document scan.
 
     The error is considered resolved when the file with the document
     scan changes.
     """
 
-    source: str
+    source: Literal["file"] = "file"
     """Error source, must be file."""
 
     type: str
@@ -7411,15 +8110,19 @@ class PassportElementErrorFile(BaseModel):
     message: str
     """Error message."""
 
+    _check_type = validator("type", pre=True, allow_reuse=True)(
+        _one_of(_PASSPORT_FILE_TYPES),
+    )
 
-class PassportElementErrorFiles(BaseModel):
+
+class PassportElementErrorFiles(_TelegramModel):
     """Represents an issue with a list of scans.
 
     The error is considered resolved when the list of files containing
     the scans changes.
     """
 
-    source: str
+    source: Literal["files"] = "files"
     """Error source, must be files."""
 
     type: str
@@ -7427,21 +8130,25 @@ class PassportElementErrorFiles(BaseModel):
     “utility_bill”, “bank_statement”, “rental_agreement”,
     “passport_registration”, “temporary_registration”"""
 
-    file_hashes: List[str]
+    file_hashes: Tuple[str, ...]
     """List of base64-encoded file hashes."""
 
     message: str
     """Error message."""
 
+    _check_type = validator("type", pre=True, allow_reuse=True)(
+        _one_of(_PASSPORT_FILE_TYPES),
+    )
+
 
-class PassportElementErrorTranslationFile(BaseModel):
+class PassportElementErrorTranslationFile(_TelegramModel):
     """Represents an issue with one of the files that constitute the
     translation of a document.
 
     The error is considered resolved when the file changes.
     """
 
-    source: str
+    source: Literal["translation_file"] = "translation_file"
     """Error source, must be translation_file."""
 
     type: str
@@ -7456,15 +8163,19 @@ class PassportElementErrorTranslationFile(BaseModel):
     message: str
     """Error message."""
 
+    _check_type = validator("type", pre=True, allow_reuse=True)(
+        _one_of(_PASSPORT_TRANSLATION_TYPES),
+    )
+
 
-class PassportElementErrorTranslationFiles(BaseModel):
+class PassportElementErrorTranslationFiles(_TelegramModel):
     """Represents an issue with the translated version of a document.
 
     The error is considered resolved when a file with the document
     translation change.
     """
 
-    source: str
+    source: Literal["translation_files"] = "translation_files"
     """Error source, must be translation_files."""
 
     type: str
@@ -7473,20 +8184,24 @@ class PassportElementErrorTranslationFiles(BaseModel):
     “utility_bill”, “bank_statement”, “rental_agreement”,
     “passport_registration”, “temporary_registration”"""
 
-    file_hashes: List[str]
+    file_hashes: Tuple[str, ...]
     """List of base64-encoded file hashes."""
 
     message: str
     """Error message."""
 
+    _check_type = validator("type", pre=True, allow_reuse=True)(
+        _one_of(_PASSPORT_TRANSLATION_TYPES),
+    )
 
-class PassportElementErrorUnspecified(BaseModel):
+
+class PassportElementErrorUnspecified(_TelegramModel):
     """Represents an issue in an unspecified place.
 
     The error is considered resolved when new data is added.
     """
 
-    source: str
+    source: Literal["unspecified"] = "unspecified"
     """Error source, must be unspecified."""
 
     type: str
@@ -7498,8 +8213,12 @@ class PassportElementErrorUnspecified(BaseModel):
     message: str
     """Error message."""
 
+    _check_type = validator("type", pre=True, allow_reuse=True)(
+        _one_of(PASSPORT_ELEMENT_TYPES),
+    )
+
 
-class Game(BaseModel):
+class Game(_TelegramModel):
     """This object represents a game.
 
     Use BotFather to create and edit games, their short names will act
@@ -7539,14 +8258,14 @@ class Game(BaseModel):
     """
 
 
-class CallbackGame(BaseModel):
+class CallbackGame(_MarkerModel):
     """A placeholder, currently holds no information.
 
     Use BotFather to set up your game.
     """
 
 
-class GameHighScore(BaseModel):
+class GameHighScore(_TelegramModel):
     """This object represents one row of the high scores table for a game."""
 
     position: int
@@ -7559,95 +8278,130 @@ class GameHighScore(BaseModel):
     """Score."""
 
 
+# Inaccessible messages are told apart by their ``date``, which would be a valid
+# date of a regular message as well, so they must be tried first.
 MaybeInaccessibleMessage = Union[
-    Message,
     InaccessibleMessage,
+    Message,
 ]
 
 
-MessageOrigin = Union[
-    MessageOriginUser,
-    MessageOriginHiddenUser,
-    MessageOriginChat,
-    MessageOriginChannel,
+MessageOrigin = Annotated[
+    Union[
+        MessageOriginUser,
+        MessageOriginHiddenUser,
+        MessageOriginChat,
+        MessageOriginChannel,
+    ],
+    Field(discriminator="type"),
 ]
 
 
-PaidMedia = Union[
-    PaidMediaPreview,
-    PaidMediaPhoto,
-    PaidMediaVideo,
+PaidMedia = Annotated[
+    Union[
+        PaidMediaPreview,
+        PaidMediaPhoto,
+        PaidMediaVideo,
+    ],
+    Field(discriminator="type"),
 ]
 
 
-BackgroundFill = Union[
-    BackgroundFillSolid,
-    BackgroundFillGradient,
-    BackgroundFillFreeformGradient,
+BackgroundFill = Annotated[
+    Union[
+        BackgroundFillSolid,
+        BackgroundFillGradient,
+        BackgroundFillFreeformGradient,
+    ],
+    Field(discriminator="type"),
 ]
 
 
-BackgroundType = Union[
-    BackgroundTypeFill,
-    BackgroundTypeWallpaper,
-    BackgroundTypePattern,
-    BackgroundTypeChatTheme,
+BackgroundType = Annotated[
+    Union[
+        BackgroundTypeFill,
+        BackgroundTypeWallpaper,
+        BackgroundTypePattern,
+        BackgroundTypeChatTheme,
+    ],
+    Field(discriminator="type"),
 ]
 
 
-ChatMember = Union[
-    ChatMemberOwner,
-    ChatMemberAdministrator,
-    ChatMemberMember,
-    ChatMemberRestricted,
-    ChatMemberLeft,
-    ChatMemberBanned,
+ChatMember = Annotated[
+    Union[
+        ChatMemberOwner,
+        ChatMemberAdministrator,
+        ChatMemberMember,
+        ChatMemberRestricted,
+        ChatMemberLeft,
+        ChatMemberBanned,
+    ],
+    Field(discriminator="status"),
 ]
 
 
-ReactionType = Union[
-    ReactionTypeEmoji,
-    ReactionTypeCustomEmoji,
+ReactionType = Annotated[
+    Union[
+        ReactionTypeEmoji,
+        ReactionTypeCustomEmoji,
+    ],
+    Field(discriminator="type"),
 ]
 
 
-BotCommandScope = Union[
-    BotCommandScopeDefault,
-    BotCommandScopeAllPrivateChats,
-    BotCommandScopeAllGroupChats,
-    BotCommandScopeAllChatAdministrators,
-    BotCommandScopeChat,
-    BotCommandScopeChatAdministrators,
-    BotCommandScopeChatMember,
+BotCommandScope = Annotated[
+    Union[
+        BotCommandScopeDefault,
+        BotCommandScopeAllPrivateChats,
+        BotCommandScopeAllGroupChats,
+        BotCommandScopeAllChatAdministrators,
+        BotCommandScopeChat,
+        BotCommandScopeChatAdministrators,
+        BotCommandScopeChatMember,
+    ],
+    Field(discriminator="type"),
 ]
 
 
-MenuButton = Union[
-    MenuButtonCommands,
-    MenuButtonWebApp,
-    MenuButtonDefault,
+MenuButton = Annotated[
+    Union[
+        MenuButtonCommands,
+        MenuButtonWebApp,
+        MenuButtonDefault,
+    ],
+    Field(discriminator="type"),
 ]
 
 
-ChatBoostSource = Union[
-    ChatBoostSourcePremium,
-    ChatBoostSourceGiftCode,
-    ChatBoostSourceGiveaway,
+ChatBoostSource = Annotated[
+    Union[
+        ChatBoostSourcePremium,
+        ChatBoostSourceGiftCode,
+        ChatBoostSourceGiveaway,
+    ],
+    Field(discriminator="source"),
 ]
 
 
-InputMedia = Union[
-    InputMediaAnimation,
-    InputMediaDocument,
-    InputMediaAudio,
-    InputMediaPhoto,
-    InputMediaVideo,
+InputMedia = Annotated[
+    Union[
+        InputMediaAnimation,
+        InputMediaDocument,
+        InputMediaAudio,
+        InputMediaPhoto,
+        InputMediaVideo,
+    ],
+    Field(discriminator="type"),
 ]
 
 
-InputPaidMedia = Union[
-    InputPaidMediaPhoto,
-    InputPaidMediaVideo,
+InputPaidMedia = Annotated[
+    Union[
+        InputPaidMediaPhoto,
+        InputPaidMediaVideo,
+    ],
+    Field(discriminator="type"),
 ]
 
 
@@ -7675,447 +8429,135 @@ InlineQueryResult = Union[
 ]
 
 
+# Venues carry every field of a location, so they must be tried first.
 InputMessageContent = Union[
     InputTextMessageContent,
-    InputLocationMessageContent,
     InputVenueMessageContent,
+    InputLocationMessageContent,
     InputContactMessageContent,
     InputInvoiceMessageContent,
 ]
 
 
-RevenueWithdrawalState = Union[
-    RevenueWithdrawalStatePending,
-    RevenueWithdrawalStateSucceeded,
-    RevenueWithdrawalStateFailed,
+RevenueWithdrawalState = Annotated[
+    Union[
+        RevenueWithdrawalStatePending,
+        RevenueWithdrawalStateSucceeded,
+        RevenueWithdrawalStateFailed,
+    ],
+    Field(discriminator="type"),
 ]
 
 
-TransactionPartner = Union[
-    TransactionPartnerUser,
-    TransactionPartnerFragment,
-    TransactionPartnerTelegramAds,
-    TransactionPartnerOther,
+TransactionPartner = Annotated[
+    Union[
+        TransactionPartnerUser,
+        TransactionPartnerFragment,
+        TransactionPartnerTelegramAds,
+        TransactionPartnerOther,
+    ],
+    Field(discriminator="type"),
 ]
 
 
-PassportElementError = Union[
-    PassportElementErrorDataField,
-    PassportElementErrorFrontSide,
-    PassportElementErrorReverseSide,
-    PassportElementErrorSelfie,
-    PassportElementErrorFile,
-    PassportElementErrorFiles,
-    PassportElementErrorTranslationFile,
-    PassportElementErrorTranslationFiles,
-    PassportElementErrorUnspecified,
+PassportElementError = Annotated[
+    Union[
+        PassportElementErrorDataField,
+        PassportElementErrorFrontSide,
+        PassportElementErrorReverseSide,
+        PassportElementErrorSelfie,
+        PassportElementErrorFile,
+        PassportElementErrorFiles,
+        PassportElementErrorTranslationFile,
+        PassportElementErrorTranslationFiles,
+        PassportElementErrorUnspecified,
+    ],
+    Field(discriminator="source"),
 ]
 
 
 InputFile = Any
 
-Update.update_forward_refs()
-
-WebhookInfo.update_forward_refs()
-
-User.update_forward_refs()
-
-Chat.update_forward_refs()
-
-ChatFullInfo.update_forward_refs()
-
-Message.update_forward_refs()
-
-MessageId.update_forward_refs()
-
-InaccessibleMessage.update_forward_refs()
-
-MessageEntity.update_forward_refs()
-
-TextQuote.update_forward_refs()
-
-ExternalReplyInfo.update_forward_refs()
-
-ReplyParameters.update_forward_refs()
-
-MessageOriginUser.update_forward_refs()
-
-MessageOriginHiddenUser.update_forward_refs()
-
-MessageOriginChat.update_forward_refs()
-
-MessageOriginChannel.update_forward_refs()
-
-PhotoSize.update_forward_refs()
-
-Animation.update_forward_refs()
-
-Audio.update_forward_refs()
-
-Document.update_forward_refs()
-
-Story.update_forward_refs()
-
-Video.update_forward_refs()
-
-VideoNote.update_forward_refs()
-
-Voice.update_forward_refs()
-
-PaidMediaInfo.update_forward_refs()
-
-PaidMediaPreview.update_forward_refs()
-
-PaidMediaPhoto.update_forward_refs()
-
-PaidMediaVideo.update_forward_refs()
-
-Contact.update_forward_refs()
-
-Dice.update_forward_refs()
-
-PollOption.update_forward_refs()
-
-InputPollOption.update_forward_refs()
-
-PollAnswer.update_forward_refs()
-
-Poll.update_forward_refs()
-
-Location.update_forward_refs()
-
-Venue.update_forward_refs()
-
-WebAppData.update_forward_refs()
-
-ProximityAlertTriggered.update_forward_refs()
-
-MessageAutoDeleteTimerChanged.update_forward_refs()
-
-ChatBoostAdded.update_forward_refs()
-
-BackgroundFillSolid.update_forward_refs()
-
-BackgroundFillGradient.update_forward_refs()
-
-BackgroundFillFreeformGradient.update_forward_refs()
-
-BackgroundTypeFill.update_forward_refs()
-
-BackgroundTypeWallpaper.update_forward_refs()
-
-BackgroundTypePattern.update_forward_refs()
-
-BackgroundTypeChatTheme.update_forward_refs()
-
-ChatBackground.update_forward_refs()
-
-ForumTopicCreated.update_forward_refs()
-
-ForumTopicClosed.update_forward_refs()
-
-ForumTopicEdited.update_forward_refs()
-
-ForumTopicReopened.update_forward_refs()
-
-GeneralForumTopicHidden.update_forward_refs()
-
-GeneralForumTopicUnhidden.update_forward_refs()
-
-SharedUser.update_forward_refs()
-
-UsersShared.update_forward_refs()
-
-ChatShared.update_forward_refs()
-
-WriteAccessAllowed.update_forward_refs()
-
-VideoChatScheduled.update_forward_refs()
-
-VideoChatStarted.update_forward_refs()
-
-VideoChatEnded.update_forward_refs()
-
-VideoChatParticipantsInvited.update_forward_refs()
-
-GiveawayCreated.update_forward_refs()
-
-Giveaway.update_forward_refs()
-
-GiveawayWinners.update_forward_refs()
-
-GiveawayCompleted.update_forward_refs()
-
-LinkPreviewOptions.update_forward_refs()
-
-UserProfilePhotos.update_forward_refs()
-
-File.update_forward_refs()
-
-WebAppInfo.update_forward_refs()
-
-ReplyKeyboardMarkup.update_forward_refs()
-
-KeyboardButton.update_forward_refs()
-
-KeyboardButtonRequestUsers.update_forward_refs()
-
-KeyboardButtonRequestChat.update_forward_refs()
-
-KeyboardButtonPollType.update_forward_refs()
-
-ReplyKeyboardRemove.update_forward_refs()
-
-InlineKeyboardMarkup.update_forward_refs()
-
-InlineKeyboardButton.update_forward_refs()
-
-LoginUrl.update_forward_refs()
-
-SwitchInlineQueryChosenChat.update_forward_refs()
-
-CallbackQuery.update_forward_refs()
-
-ForceReply.update_forward_refs()
-
-ChatPhoto.update_forward_refs()
-
-ChatInviteLink.update_forward_refs()
-
-ChatAdministratorRights.update_forward_refs()
-
-ChatMemberUpdated.update_forward_refs()
-
-ChatMemberOwner.update_forward_refs()
-
-ChatMemberAdministrator.update_forward_refs()
-
-ChatMemberMember.update_forward_refs()
-
-ChatMemberRestricted.update_forward_refs()
-
-ChatMemberLeft.update_forward_refs()
-
-ChatMemberBanned.update_forward_refs()
-
-ChatJoinRequest.update_forward_refs()
-
-ChatPermissions.update_forward_refs()
-
-Birthdate.update_forward_refs()
-
-BusinessIntro.update_forward_refs()
-
-BusinessLocation.update_forward_refs()
-
-BusinessOpeningHoursInterval.update_forward_refs()
-
-BusinessOpeningHours.update_forward_refs()
-
-ChatLocation.update_forward_refs()
-
-ReactionTypeEmoji.update_forward_refs()
-
-ReactionTypeCustomEmoji.update_forward_refs()
-
-ReactionCount.update_forward_refs()
-
-MessageReactionUpdated.update_forward_refs()
-
-MessageReactionCountUpdated.update_forward_refs()
-
-ForumTopic.update_forward_refs()
-
-BotCommand.update_forward_refs()
-
-BotCommandScopeDefault.update_forward_refs()
-
-BotCommandScopeAllPrivateChats.update_forward_refs()
-
-BotCommandScopeAllGroupChats.update_forward_refs()
-
-BotCommandScopeAllChatAdministrators.update_forward_refs()
-
-BotCommandScopeChat.update_forward_refs()
-
-BotCommandScopeChatAdministrators.update_forward_refs()
-
-BotCommandScopeChatMember.update_forward_refs()
-
-BotName.update_forward_refs()
-
-BotDescription.update_forward_refs()
-
-BotShortDescription.update_forward_refs()
-
-MenuButtonCommands.update_forward_refs()
-
-MenuButtonWebApp.update_forward_refs()
-
-MenuButtonDefault.update_forward_refs()
-
-ChatBoostSourcePremium.update_forward_refs()
-
-ChatBoostSourceGiftCode.update_forward_refs()
-
-ChatBoostSourceGiveaway.update_forward_refs()
-
-ChatBoost.update_forward_refs()
-
-ChatBoostUpdated.update_forward_refs()
-
-ChatBoostRemoved.update_forward_refs()
-
-UserChatBoosts.update_forward_refs()
-
-BusinessConnection.update_forward_refs()
-
-BusinessMessagesDeleted.update_forward_refs()
-
-ResponseParameters.update_forward_refs()
-
-InputMediaPhoto.update_forward_refs()
-
-InputMediaVideo.update_forward_refs()
-
-InputMediaAnimation.update_forward_refs()
-
-InputMediaAudio.update_forward_refs()
-
-InputMediaDocument.update_forward_refs()
-
-InputPaidMediaPhoto.update_forward_refs()
-
-InputPaidMediaVideo.update_forward_refs()
-
-Sticker.update_forward_refs()
-
-StickerSet.update_forward_refs()
-
-MaskPosition.update_forward_refs()
-
-InputSticker.update_forward_refs()
-
-InlineQuery.update_forward_refs()
-
-InlineQueryResultsButton.update_forward_refs()
-
-InlineQueryResultArticle.update_forward_refs()
-
-InlineQueryResultPhoto.update_forward_refs()
-
-InlineQueryResultGif.update_forward_refs()
-
-InlineQueryResultMpeg4Gif.update_forward_refs()
-
-InlineQueryResultVideo.update_forward_refs()
-
-InlineQueryResultAudio.update_forward_refs()
-
-InlineQueryResultVoice.update_forward_refs()
-
-InlineQueryResultDocument.update_forward_refs()
-
-InlineQueryResultLocation.update_forward_refs()
-
-InlineQueryResultVenue.update_forward_refs()
-
-InlineQueryResultContact.update_forward_refs()
-
-InlineQueryResultGame.update_forward_refs()
-
-InlineQueryResultCachedPhoto.update_forward_refs()
-
-InlineQueryResultCachedGif.update_forward_refs()
-
-InlineQueryResultCachedMpeg4Gif.update_forward_refs()
-
-InlineQueryResultCachedSticker.update_forward_refs()
-
-InlineQueryResultCachedDocument.update_forward_refs()
-
-InlineQueryResultCachedVideo.update_forward_refs()
-
-InlineQueryResultCachedVoice.update_forward_refs()
-
-InlineQueryResultCachedAudio.update_forward_refs()
-
-InputTextMessageContent.update_forward_refs()
-
-InputLocationMessageContent.update_forward_refs()
-
-InputVenueMessageContent.update_forward_refs()
-
-InputContactMessageContent.update_forward_refs()
-
-InputInvoiceMessageContent.update_forward_refs()
-
-ChosenInlineResult.update_forward_refs()
-
-SentWebAppMessage.update_forward_refs()
-
-LabeledPrice.update_forward_refs()
-
-Invoice.update_forward_refs()
-
-ShippingAddress.update_forward_refs()
-
-OrderInfo.update_forward_refs()
-
-ShippingOption.update_forward_refs()
-
-SuccessfulPayment.update_forward_refs()
-
-ShippingQuery.update_forward_refs()
-
-PreCheckoutQuery.update_forward_refs()
-
-RevenueWithdrawalStatePending.update_forward_refs()
-
-RevenueWithdrawalStateSucceeded.update_forward_refs()
-
-RevenueWithdrawalStateFailed.update_forward_refs()
-
-TransactionPartnerUser.update_forward_refs()
-
-TransactionPartnerFragment.update_forward_refs()
-
-TransactionPartnerTelegramAds.update_forward_refs()
-
-TransactionPartnerOther.update_forward_refs()
-
-StarTransaction.update_forward_refs()
-
-StarTransactions.update_forward_refs()
-
-PassportData.update_forward_refs()
-
-PassportFile.update_forward_refs()
-
-EncryptedPassportElement.update_forward_refs()
-
-EncryptedCredentials.update_forward_refs()
-
-PassportElementErrorDataField.update_forward_refs()
-
-PassportElementErrorFrontSide.update_forward_refs()
-
-PassportElementErrorReverseSide.update_forward_refs()
-
-PassportElementErrorSelfie.update_forward_refs()
-
-PassportElementErrorFile.update_forward_refs()
-
-PassportElementErrorFiles.update_forward_refs()
-
-PassportElementErrorTranslationFile.update_forward_refs()
-
-PassportElementErrorTranslationFiles.update_forward_refs()
-
-PassportElementErrorUnspecified.update_forward_refs()
-
-Game.update_forward_refs()
-
-CallbackGame.update_forward_refs()
 
-GameHighScore.update_forward_refs()
+def _prepare_models() -> None:
+    """Resolve string annotations of every model in a single pass, once all
+    models and union aliases above are defined, and build caches of trusted
+    construction for them."""
+
+    models = [
+        model
+        for model in globals().values()
+        if isinstance(model, type) and issubclass(model, _TelegramModel)
+    ]
+    for model in models:
+        model.update_forward_refs()
+        resolve_discriminators(model)
+    for model in models:
+        prepare_trusted(model)
+
+
+_prepare_models()
+
+#: Dict[str, Type[_TelegramModel]]: Members of ``InlineQueryResult`` by type.
+_INLINE_QUERY_RESULTS: Dict[str, Type[_TelegramModel]] = {}
+#: Dict[str, Tuple[str, Type[_TelegramModel]]]: Members of ``InlineQueryResult``
+#  referring to files cached on Telegram servers, by type, with the name of
+#  their file identifier field.
+_CACHED_INLINE_QUERY_RESULTS: Dict[str, Tuple[str, Type[_TelegramModel]]] = {}
+
+
+def _index_inline_query_results() -> None:
+    """Fill members of ``InlineQueryResult`` by type."""
+
+    for model in get_args(InlineQueryResult):
+        type_ = model.__fields__["type"].default
+        file_id_fields = [
+            name for name in model.__fields__ if name.endswith("_file_id")
+        ]
+        if file_id_fields:
+            _CACHED_INLINE_QUERY_RESULTS[type_] = (file_id_fields[0], model)
+        else:
+            _INLINE_QUERY_RESULTS[type_] = model
+
+
+_index_inline_query_results()
+
+
+def parse_inline_query_result(data: Dict[str, Any]) -> InlineQueryResult:
+    """Validate an inline query result, picking its model by ``type``.
+
+    Cached and regular results share types (e.g. ``photo``), so results
+    carrying a file identifier are told apart from ones carrying a URL by
+    that field. Only the picked model is validated, instead of trying every
+    member of the union in turn.
+
+    Raises:
+        ValidationError: if data does not match any inline query result.
+    """
+
+    type_ = data.get("type")
+    cached = _CACHED_INLINE_QUERY_RESULTS.get(type_)
+    if cached is not None and cached[0] in data:
+        return cached[1].parse_obj(data)
+    model = _INLINE_QUERY_RESULTS.get(type_)
+    if model is not None:
+        return model.parse_obj(data)
+    return parse_obj_as(InlineQueryResult, data)
+
+
+# Objects below hold no data (or only a handful of combinations of it), so a
+# single shared instance of each is enough.
+FORUM_TOPIC_CLOSED = ForumTopicClosed.shared()
+FORUM_TOPIC_REOPENED = ForumTopicReopened.shared()
+GENERAL_FORUM_TOPIC_HIDDEN = GeneralForumTopicHidden.shared()
+GENERAL_FORUM_TOPIC_UNHIDDEN = GeneralForumTopicUnhidden.shared()
+VIDEO_CHAT_STARTED = VideoChatStarted.shared()
+GIVEAWAY_CREATED = GiveawayCreated.shared()
+CALLBACK_GAME = CallbackGame.shared()
+REPLY_KEYBOARD_REMOVE = ReplyKeyboardRemove.create()
+BOT_COMMAND_SCOPE_DEFAULT = BotCommandScopeDefault()
+BOT_COMMAND_SCOPE_ALL_PRIVATE_CHATS = BotCommandScopeAllPrivateChats()
+BOT_COMMAND_SCOPE_ALL_GROUP_CHATS = BotCommandScopeAllGroupChats()
+BOT_COMMAND_SCOPE_ALL_CHAT_ADMINISTRATORS = BotCommandScopeAllChatAdministrators()
+MENU_BUTTON_COMMANDS = MenuButtonCommands()
+MENU_BUTTON_DEFAULT = MenuButtonDefault()
@@ -2,7 +2,6 @@
 
 from typing import Optional
 
-import pydantic
 from pydantic.fields import Field
 
 from app.pkg.clients.telegram.models import BaseTelegramClient
@@ -11,6 +10,7 @@ from app.pkg.clients.telegram.models.request import (
     ChatMember,
     File,
     Message,
+    UserChatBoosts,
 )
 
 
@@ -35,8 +35,16 @@ class TelegramAPIGetChatResponse(TelegramAPIBaseResponse):
 class TelegramAPIGetChatMemberResponse(TelegramAPIBaseResponse):
     """Telegram API get chat member response."""
 
-    result: ChatMember = Field(
-        description="Chat member information.",
+    #: ChatMember: Chat member information. The member type is picked by its
+    #  ``status``, so the annotation can't be combined with ``Field``.
+    result: ChatMember
+
+
+class TelegramAPIGetUserChatBoostsResponse(TelegramAPIBaseResponse):
+    """Telegram API get user chat boosts response."""
+
+    result: UserChatBoosts = Field(
+        description="Boosts added to the chat by the user.",
     )
 
 
@@ -71,7 +79,7 @@ class TelegramAPISendMessageResponse(TelegramAPIBaseResponse):
         description="Sent message instance.",
     )
 
-    error_code: Optional[pydantic.PositiveInt] = Field(
+    error_code: Optional[int] = Field(
         description="Error code.",
     )
 
@@ -89,7 +97,7 @@ class TelegramFileResponse(TelegramAPIBaseResponse):
         description="File ID.",
     )
 
-    error_code: Optional[pydantic.PositiveInt] = Field(
+    error_code: Optional[int] = Field(
         description="Error code.",
     )
 
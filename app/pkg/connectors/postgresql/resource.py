@@ -1,6 +1,7 @@
 """Async resource for PostgresSQL connector."""
 
 import aiopg
+from psycopg2.extras import register_uuid  # type: ignore
 
 from app.pkg.connectors.resources import BaseAsyncResource
 
@@ -16,10 +17,15 @@ class Postgresql(BaseAsyncResource):
         Args:
             dsn: D.S.N - Data Source Name.
 
+        Notes:
+            ``uuid`` columns are returned as :class:`uuid.UUID`, so rows match
+            the models built from them without validation.
+
         Returns:
             Created connection pool.
         """
 
+        register_uuid()
         return await aiopg.create_pool(dsn=dsn, *args, **kwargs)
 
     async def shutdown(self, resource: aiopg.Pool):
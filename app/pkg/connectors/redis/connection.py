@@ -1,50 +1,95 @@
 """Create connection to redis."""
 
 from contextlib import asynccontextmanager
-from typing import Union
+from typing import AsyncIterator, Optional
 
 import redis.asyncio
 import redis.asyncio.client
 from dependency_injector.wiring import Provide, inject
 
 from app.pkg.connectors import Connectors
+from app.pkg.connectors.redis import resource
 
-__all__ = ["get_connection", "acquire_connection"]
+__all__ = ["get_pool", "get_connection", "acquire_connection"]
 
 
-@asynccontextmanager
 @inject
-async def get_connection(
+async def _resolve_pool(
     pool: redis.asyncio.Redis = Provide[Connectors.redis.connector],
-    return_pool: bool = False,
-) -> Union[redis.asyncio.Redis, redis.asyncio.client.Pipeline]:  # type: ignore
-    """Get async connection pool to redis.
+) -> redis.asyncio.Redis:
+    """Resolve redis client from the container, initializing it if needed.
+
+    Called only while :attr:`.resource.Redis.client` is unset, so commands
+    don't pay for the check below. The provider gives a future while it
+    initializes the resource, but the client itself if a resource is
+    already initialized (e.g. by another instance of the container).
+    """
+
+    if not isinstance(pool, redis.asyncio.Redis):
+        pool = await pool
+    return pool
+
+
+async def _get_pool() -> redis.asyncio.Redis:
+    """Get redis client of the initialized resource.
+
+    The container is asked only while no resource is initialized, e.g. on
+    the first call or after a shutdown, since the resource keeps its client
+    in :attr:`.resource.Redis.client` until it is closed.
+    """
+
+    client = resource.Redis.client
+    if client is None:
+        client = await _resolve_pool()
+    return client
+
+
+@asynccontextmanager
+async def get_pool() -> AsyncIterator[redis.asyncio.Redis]:
+    """Get async client of redis.
+
+    Single commands are sent right away, the client takes a connection from
+    its pool for every command.
+
+    Examples:
+        If you have a function that contains a single query in redis,
+        context manager :func:`.get_pool` will get redis client::
+
+            >>> async def read_some_hash(key: str) -> dict:
+            ...     async with get_pool() as c:
+            ...         return await c.hgetall(key)
+
+    Returns:
+        Async client of redis.
+    """
+
+    yield await _get_pool()
+
+
+@asynccontextmanager
+async def get_connection(
+    pool: Optional[redis.asyncio.Redis] = None,
+) -> AsyncIterator[redis.asyncio.client.Pipeline]:
+    """Get async connection to redis executing commands in a transaction.
 
     Args:
         pool:
-            redis connection pool.
-        return_pool:
-            if True, return pool, else return connection.
+            redis connection pool. Default: client from the container.
 
     Examples:
-        If you have a function that contains a query in redis,
-        context manager :func:`.get_connection`
-        will get async connection to redis
-        of pool::
+        If you have a function that contains several queries in redis, which
+        must be applied together, context manager :func:`.get_connection`
+        will get transactional pipeline of pool::
 
-            >>> async def exec_some_sql_function() -> None:
+            >>> async def replace_some_hash(key: str, value: dict) -> None:
             ...     async with get_connection() as c:
-            ...         await c.execute("SELECT * FROM users")
+            ...         await c.delete(key).hset(key, mapping=value).execute()
 
     Returns:
         Async connection to redis.
     """
-    if not isinstance(pool, redis.asyncio.Redis):
-        pool = await pool
-
-    if return_pool:
-        yield pool
-        return
+    if pool is None:
+        pool = await _get_pool()
 
     async with acquire_connection(pool) as channel:
         yield channel
@@ -53,9 +98,11 @@ async def get_connection(
 @asynccontextmanager
 async def acquire_connection(
     pool: redis.asyncio.Redis,
-) -> redis.asyncio.client.Pipeline:  # type: ignore
+) -> AsyncIterator[redis.asyncio.client.Pipeline]:
     """Acquire connection from pool.
 
+    Queued commands are executed in MULTI/EXEC on ``execute()``.
+
     Args:
         pool:
             Settings from :func:`.get_connection` redis pool.
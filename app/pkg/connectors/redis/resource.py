@@ -1,17 +1,36 @@
 """Async resource for Redis connector."""
 import asyncio
+import socket
+from typing import ClassVar, Optional
 
 import redis.asyncio
 
 from app.pkg.connectors.resources import BaseAsyncResource
 
 
+#: Dict[int, int]: Start probing idle connections after a minute, where the
+#  platform supports it.
+_KEEPALIVE_OPTIONS = (
+    {socket.TCP_KEEPIDLE: 60} if hasattr(socket, "TCP_KEEPIDLE") else {}
+)
+
+
 class Redis(BaseAsyncResource):
     """Redis connector using aioredis."""
 
+    #: Optional[redis.asyncio.Redis]: Client of the initialized resource, kept
+    #  until it is shut down, so callers don't resolve it from the container
+    #  on every command.
+    client: ClassVar[Optional[redis.asyncio.Redis]] = None
+
     async def init(self, dsn: str, *args, **kwargs) -> redis.asyncio.Redis:
         """Getting connection pool in asynchronous.
 
+        Replies are parsed by ``hiredis`` (installed with the ``redis`` extra)
+        and decoded to ``str`` by the parser itself. Idle connections of the
+        pool are kept alive by TCP keepalive and checked before reuse, instead
+        of failing on the next command and being reconnected.
+
         Args:
             dsn: D.S.N - Data Source Name.
 
@@ -19,10 +38,15 @@ class Redis(BaseAsyncResource):
             Created connection pool.
         """
 
-        return redis.asyncio.from_url(
+        Redis.client = redis.asyncio.from_url(
             url=dsn,
+            decode_responses=True,
+            health_check_interval=30,
+            socket_keepalive=True,
+            socket_keepalive_options=_KEEPALIVE_OPTIONS,
             **kwargs,
         )
+        return Redis.client
 
     async def shutdown(self, resource: redis.asyncio.Redis):
         """Close connection.
@@ -39,4 +63,5 @@ class Redis(BaseAsyncResource):
         if isinstance(resource, asyncio.Task):
             resource = await resource
 
+        Redis.client = None
         await resource.aclose()
@@ -2,7 +2,6 @@
 
 from dataclasses import dataclass
 from typing import Callable, List, Optional
-import uuid
 
 from pydantic import Field
 
@@ -44,5 +43,7 @@ UpdateHandler = Callable[[Update], List[TelegramAPISendMessageResponse]]
 class FSMRouter:
     """Routing of messages."""
 
+    __slots__ = ("handler", "validator")
+
     handler: UpdateHandler
     validator: StateValidator
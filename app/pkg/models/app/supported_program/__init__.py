@@ -1,6 +1,5 @@
 """Supported program model fields."""
 
-from typing import List, Optional
 import uuid
 
 from pydantic import Field
@@ -1,8 +1,5 @@
 """User specific model fields."""
 
-from typing import List, Optional
-import uuid
-
 from pydantic import Field, PositiveInt
 
 from app.pkg.models.base import BaseModel
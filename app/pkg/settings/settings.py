@@ -22,6 +22,31 @@ from app.pkg.models.core.logger import LoggerLevel
 __all__ = ["Settings", "get_settings"]
 
 
+@lru_cache(maxsize=None)
+def _build_dsn(
+    dsn_type: typing.Type[AnyUrl],
+    scheme: str,
+    user: str,
+    password: str,
+    host: str,
+    port: int,
+    path: str,
+) -> str:
+    """Build DSN once per distinct set of connection settings.
+
+    The password is quoted, so any characters may be used in it.
+    """
+
+    return dsn_type.build(
+        scheme=scheme,
+        user=user,
+        password=urllib.parse.quote_plus(password),
+        host=host,
+        port=str(port),
+        path=path,
+    )
+
+
 class _Settings(BaseSettings):
     """Base settings for all settings.
 
@@ -92,7 +117,7 @@ class Postgresql(_Settings):
     #  Builds in `root_validator` method.
     DSN: typing.Optional[str] = None
 
-    @root_validator(pre=True)
+    @root_validator(skip_on_failure=True)
     def build_dsn(cls, values: dict):  # pylint: disable=no-self-argument
         """Build DSN for postgresql.
 
@@ -100,7 +125,8 @@ class Postgresql(_Settings):
             values: dict with all settings.
 
         Notes:
-            This method is called before any other validation.
+            This method is called after fields are validated, so defaults are
+            applied and ``PASSWORD`` is a ``SecretStr``.
             I use it to build DSN for postgresql.
 
         See Also:
@@ -114,13 +140,14 @@ class Postgresql(_Settings):
             dict with all settings and DSN.
         """
 
-        values["DSN"] = PostgresDsn.build(
+        values["DSN"] = _build_dsn(
+            PostgresDsn,
             scheme="postgresql",
-            user=f"{values.get('USER')}",
-            password=f"{urllib.parse.quote_plus(values.get('PASSWORD'))}",
-            host=f"{values.get('HOST')}",
-            port=f"{values.get('PORT')}",
-            path=f"/{values.get('DATABASE_NAME')}",
+            user=values["USER"],
+            password=values["PASSWORD"].get_secret_value(),
+            host=values["HOST"],
+            port=values["PORT"],
+            path=f"/{values['DATABASE_NAME']}",
         )
         return values
 
@@ -145,7 +172,7 @@ class Redis(_Settings):
     #  Builds in `root_validator` method.
     DSN: typing.Optional[str] = None
 
-    @root_validator(pre=True)
+    @root_validator(skip_on_failure=True)
     def build_dsn(cls, values: dict):  # pylint: disable=no-self-argument
         """Build DSN for cache.
 
@@ -153,7 +180,8 @@ class Redis(_Settings):
             values: dict with all settings.
 
         Notes:
-            This method is called before any other validation.
+            This method is called after fields are validated, so defaults are
+            applied and ``PASSWORD`` is a ``SecretStr``.
             I use it to build DSN for cache.
 
         See Also:
@@ -167,13 +195,14 @@ class Redis(_Settings):
             dict with all settings and DSN.
         """
 
-        values["DSN"] = RedisDsn.build(
+        values["DSN"] = _build_dsn(
+            RedisDsn,
             scheme="redis",
-            user=f"{values.get('USER', '')}",
-            password=f"{urllib.parse.quote_plus(values.get('PASSWORD'))}",
-            host=f"{values.get('HOST')}",
-            port=f"{values.get('PORT')}",
-            path=f"/{values.get('PATH')}",
+            user=values["USER"] or "",
+            password=values["PASSWORD"].get_secret_value(),
+            host=values["HOST"],
+            port=values["PORT"],
+            path=f"/{values['PATH']}",
         )
         return values
 
@@ -0,0 +1,46 @@
+"""Testing the :func:`collect_response`."""
+
+import uuid
+from decimal import Decimal
+from typing import List
+
+from app.internal.repository.postgresql.handlers.collect_response import (
+    collect_response,
+)
+from app.pkg.models.app.supported_program.repository import SupportedProgramResponse
+from app.pkg.models.app.user_specific.repository import UserSpecificResponse
+
+
+async def test_collect_response_single_model():
+    @collect_response
+    async def read() -> UserSpecificResponse:
+        return {"user_id": 1, "specific": "robotics"}
+
+    assert await read() == UserSpecificResponse(user_id=1, specific="robotics")
+
+
+async def test_collect_response_list_of_models():
+    program_id = uuid.uuid4()
+
+    @collect_response
+    async def read() -> List[SupportedProgramResponse]:
+        return [{"id": program_id, "name": "AI", "website_url": "https://ai.itmo"}]
+
+    assert await read() == [
+        SupportedProgramResponse(
+            id=program_id,
+            name="AI",
+            website_url="https://ai.itmo",
+        ),
+    ]
+
+
+async def test_collect_response_numeric_to_int():
+    @collect_response
+    async def read() -> List[UserSpecificResponse]:
+        return [{"user_id": Decimal("123456789"), "specific": "robotics"}]
+
+    (response,) = await read()
+
+    assert type(response.user_id) is int
+    assert response.to_dict() == {"user_id": 123456789, "specific": "robotics"}
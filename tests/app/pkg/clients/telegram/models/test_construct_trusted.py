@@ -0,0 +1,161 @@
+"""Testing the :func:`construct_trusted`."""
+
+import sys
+
+import pytest
+
+from app.pkg.clients.telegram.models.request import (
+    FORUM_TOPIC_CLOSED,
+    ChatFullInfo,
+    InaccessibleMessage,
+    Message,
+    ReactionTypeCustomEmoji,
+    ReactionTypeEmoji,
+    RevenueWithdrawalStatePending,
+    StarTransactions,
+    TransactionPartnerOther,
+    TransactionPartnerTelegramAds,
+    Update,
+)
+
+_USER = {"id": 1, "is_bot": False, "first_name": "user"}
+_CHAT = {"id": 2, "type": "supergroup", "title": "chat"}
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {
+            "update_id": 1,
+            "message": {
+                "message_id": 1,
+                "date": 1,
+                "chat": _CHAT,
+                "from": _USER,
+                "text": "/start",
+                "entities": [{"type": "bot_command", "offset": 0, "length": 6}],
+                "forward_origin": {"type": "chat", "date": 1, "sender_chat": _CHAT},
+                "pinned_message": {"chat": _CHAT, "message_id": 2, "date": 0},
+            },
+        },
+        {
+            "update_id": 2,
+            "chat_member": {
+                "chat": _CHAT,
+                "from": _USER,
+                "date": 1,
+                "old_chat_member": {"status": "member", "user": _USER},
+                "new_chat_member": {"status": "kicked", "user": _USER, "until_date": 0},
+            },
+        },
+        {
+            "update_id": 3,
+            "chat_boost": {
+                "chat": _CHAT,
+                "boost": {
+                    "boost_id": "1",
+                    "add_date": 1,
+                    "expiration_date": 2,
+                    "source": {"source": "giveaway", "giveaway_message_id": 1},
+                },
+            },
+        },
+    ],
+)
+async def test_construct_trusted_equals_validated(payload: dict):
+    assert Update.from_trusted(payload) == Update.parse_obj(payload)
+
+
+async def test_construct_trusted_picks_union_members_by_tag():
+    update = Update.from_trusted(
+        {
+            "update_id": 1,
+            "message_reaction": {
+                "chat": _CHAT,
+                "message_id": 1,
+                "date": 1,
+                "old_reaction": [],
+                "new_reaction": [
+                    {"type": "emoji", "emoji": "👍"},
+                    {"type": "custom_emoji", "custom_emoji_id": "1"},
+                ],
+            },
+            "callback_query": {
+                "id": "1",
+                "from": _USER,
+                "chat_instance": "1",
+                "message": {"chat": _CHAT, "message_id": 1, "date": 0},
+            },
+        },
+    )
+
+    reactions = update.message_reaction.new_reaction
+    assert isinstance(reactions[0], ReactionTypeEmoji)
+    assert isinstance(reactions[1], ReactionTypeCustomEmoji)
+    assert isinstance(update.callback_query.message, InaccessibleMessage)
+    assert not isinstance(update.callback_query.message, Message)
+
+
+async def test_construct_trusted_interns_file_identifiers():
+    file_id = "".join(("file", "_id"))
+    update = Update.from_trusted(
+        {
+            "update_id": 1,
+            "message": {
+                "message_id": 1,
+                "date": 1,
+                "chat": _CHAT,
+                "voice": {"file_id": file_id, "file_unique_id": "1", "duration": 1},
+            },
+        },
+    )
+
+    assert update.message.voice.file_id is sys.intern(file_id)
+
+
+async def test_construct_trusted_shares_marker_instances():
+    message = Message.from_trusted(
+        {"message_id": 1, "date": 1, "chat": _CHAT, "forum_topic_closed": {}},
+    )
+
+    assert message.forum_topic_closed is FORUM_TOPIC_CLOSED
+
+
+async def test_construct_trusted_shares_transaction_markers():
+    transactions = StarTransactions.from_trusted(
+        {
+            "transactions": [
+                {
+                    "id": "1",
+                    "amount": 1,
+                    "date": 1,
+                    "source": {"type": "telegram_ads"},
+                    "receiver": {
+                        "type": "fragment",
+                        "withdrawal_state": {"type": "pending"},
+                    },
+                },
+                {"id": "2", "amount": 1, "date": 1, "source": {"type": "other"}},
+            ],
+        },
+    )
+
+    first, second = transactions.transactions
+    assert first.source is TransactionPartnerTelegramAds.shared()
+    assert first.receiver.withdrawal_state is RevenueWithdrawalStatePending.shared()
+    assert second.source is TransactionPartnerOther.shared()
+
+
+async def test_construct_trusted_shares_chat_photos():
+    photo = {
+        "small_file_id": "1",
+        "small_file_unique_id": "2",
+        "big_file_id": "3",
+        "big_file_unique_id": "4",
+    }
+    payload = {"id": 1, "type": "private", "accent_color_id": 0, "photo": photo}
+
+    first = ChatFullInfo.from_trusted(payload)
+    second = ChatFullInfo.from_trusted({**payload, "photo": dict(photo)})
+
+    assert first.photo is second.photo
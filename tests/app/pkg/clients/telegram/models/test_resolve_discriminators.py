@@ -0,0 +1,26 @@
+"""Testing the :func:`resolve_discriminators`."""
+
+import pytest
+
+from app.pkg.clients.telegram.models.request import (
+    ChatMemberUpdated,
+    MessageReactionUpdated,
+    StarTransaction,
+)
+
+
+@pytest.mark.parametrize(
+    "model,field,discriminator",
+    [
+        (ChatMemberUpdated, "new_chat_member", "status"),
+        (MessageReactionUpdated, "new_reaction", "type"),
+        (StarTransaction, "source", "type"),
+    ],
+)
+async def test_resolve_discriminators_of_forward_references(
+    model,
+    field,
+    discriminator,
+):
+    assert model.__fields__[field].discriminator_key == discriminator
+    assert model.__fields__[field].sub_fields_mapping
@@ -0,0 +1,23 @@
+"""Testing the ``build_dsn`` validators of settings."""
+
+import urllib.parse
+
+import pytest
+
+from app.pkg.settings.settings import Postgresql, Redis
+
+
+@pytest.mark.parametrize(
+    "settings",
+    [
+        lambda password: Postgresql(PASSWORD=password),
+        lambda password: Redis(PASSWORD=password, PATH=1),
+    ],
+)
+async def test_build_dsn_with_secret_password(settings):
+    password = "p@ss:w/rd"
+
+    dsn = settings(password).DSN
+
+    assert f":{urllib.parse.quote_plus(password)}@" in dsn
+    assert "**********" not in dsn